@@ -0,0 +1,119 @@
+"""
+Backfill Workers
+Fetch and render slices of the submission history in separate processes
+"""
+
+import os
+import time
+from typing import Dict, List, Tuple
+
+from file_manager import FileManager
+from leetcode_api import LeetCodeAPI
+from problem_catalog import ProblemCatalog
+
+
+def plan_shards(total: int, workers: int) -> List[Tuple[int, int]]:
+    """Split items [0, total) into one contiguous range per worker"""
+    if total <= 0:
+        return []
+    
+    size = -(-total // max(workers, 1))  # ceil division
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+def fetch_shard(job: Dict) -> List[Dict]:
+    """
+    Worker entry point: fetch and render one slice of the problems to import
+    
+    job["submissions"] holds (listing position, submission) pairs. The
+    coordinator has already reduced the listing to the newest submission per
+    problem, so each submission's details are fetched exactly once overall.
+    
+    Each worker has its own API session and waits `delay` seconds between
+    requests, so the combined request rate is split across workers.
+    Solutions are rendered into job["staging_dir"] (one folder per target);
+    nothing is written to the target repos.
+    
+    Returns one entry per problem, tagged with its listing position so the
+    coordinator can commit in a deterministic order.
+    """
+    config = job["config"]
+    delay = job["delay"]
+    
+    api = LeetCodeAPI(
+        config["leetcode_session"],
+        config.get("csrf_token", ""),
+        timeouts=config.get("request_timeouts")
+    )
+    
+    catalog = ProblemCatalog(job["catalog_path"])
+    catalog.load()
+    
+    existing = [set(ids) for ids in job["existing"]]
+    file_managers = [
+        FileManager(os.path.join(job["staging_dir"], str(i)), target.get("organize_by", "difficulty"))
+        for i, target in enumerate(job["targets"])
+    ]
+    
+    entries = []
+    for position, submission in job["submissions"]:
+        title_slug = submission.get("titleSlug")
+        problem = catalog.get(title_slug)
+        
+        details = api.get_submission_code(submission["id"], include_question=problem is None)
+        time.sleep(delay)
+        if not details:
+            print(f"  ✗ Could not fetch submission details for {title_slug}")
+            continue
+        
+        question = None
+        if problem is None:
+            question = details.get("question") or {}
+            catalog.add(question)
+            problem = catalog.get(title_slug) or {}
+        
+        problem_id = problem.get("questionId", "0")
+        language = (details.get("lang") or {}).get("name", submission.get("lang", "unknown"))
+        
+        files = {}
+        for i, (target, file_manager) in enumerate(zip(job["targets"], file_managers)):
+            if problem_id.zfill(4) in existing[i]:
+                continue
+            
+            path = file_manager.save_solution(
+                code=details.get("code", ""),
+                problem_id=problem_id,
+                title=submission.get("title"),
+                title_slug=title_slug,
+                difficulty=problem.get("difficulty", "Unknown"),
+                extension=api.get_extension(language),
+                language=language,
+                topics=problem.get("topics", []),
+                runtime=submission.get("runtime", ""),
+                memory=submission.get("memory", ""),
+                include_header=target.get("include_problem_description", True)
+            )
+            if path:
+                files[i] = os.path.relpath(path, file_manager.base_path)
+        
+        entries.append({
+            "position": position,
+            "title_slug": title_slug,
+            "title": submission.get("title"),
+            "submission": submission,
+            "problem_id": problem_id,
+            "difficulty": problem.get("difficulty", "Unknown"),
+            "question": question,
+            "staging": [file_manager.base_path for file_manager in file_managers],
+            "files": files,
+        })
+    
+    return entries
+
+
+def merge_entries(shard_results: List[List[Dict]]) -> List[Dict]:
+    """Combine shard results in listing order, as a serial run would commit them"""
+    return sorted(
+        (entry for result in shard_results for entry in result),
+        key=lambda entry: entry["position"]
+    )
@@ -0,0 +1,275 @@
+"""
+Local Benchmarks
+Times FileManager and GitHandler on generated solution repos (no network)
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import platform
+import subprocess
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from file_manager import FileManager
+from git_handler import GitHandler
+
+
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+
+# Solution files are indexed by a 4-digit problem id, so larger repos
+# hold several languages per problem
+MAX_PROBLEM_ID = 9999
+EXTENSIONS = [".py", ".cpp", ".java", ".js", ".ts", ".go", ".rs", ".c", ".cs", ".rb"]
+MAX_FILES = MAX_PROBLEM_ID * len(EXTENSIONS)
+
+# Language of the files the save/commit benchmarks write, so they never
+# overwrite a generated file
+SAVE_EXTENSION = ".kt"
+
+SAMPLE_CODE = """class Solution:
+    def twoSum(self, nums, target):
+        seen = {}
+        for i, num in enumerate(nums):
+            if target - num in seen:
+                return [seen[target - num], i]
+            seen[num] = i
+        return []
+"""
+
+SAMPLE_HTML = (
+    "<p>Given an array of integers <code>nums</code>&nbsp;and an integer "
+    "<code>target</code>, return <em>indices of the two numbers</em>.</p>\n\n"
+    "<pre><strong>Input:</strong> nums = [2,7,11,15], target = 9\n"
+    "<strong>Output:</strong> [0,1]</pre>\n\n"
+    "<ul>\n<li><code>2 &lt;= nums.length &lt;= 10<sup>4</sup></code></li>\n</ul>\n"
+) * 4
+
+
+def time_call(func: Callable, repeat: int) -> Dict:
+    """Run func `repeat` times and return timing stats in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    
+    samples.sort()
+    return {
+        "repeat": repeat,
+        "min_ms": round(samples[0], 4),
+        "median_ms": round(samples[len(samples) // 2], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def generate_repo(path: str, num_files: int, with_git: bool) -> None:
+    """Create a solution repo with `num_files` files spread over difficulties"""
+    for difficulty in DIFFICULTIES:
+        os.makedirs(os.path.join(path, difficulty), exist_ok=True)
+    
+    for i in range(num_files):
+        problem_id = i % MAX_PROBLEM_ID + 1
+        extension = EXTENSIONS[i // MAX_PROBLEM_ID]
+        difficulty = DIFFICULTIES[problem_id % 3]
+        file_path = os.path.join(path, difficulty, f"{problem_id:04d}-problem-{problem_id}{extension}")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(SAMPLE_CODE)
+    
+    if with_git:
+        git = ["git", "-c", "user.name=bench", "-c", "user.email=bench@localhost"]
+        subprocess.run(git + ["init", "-q"], cwd=path, check=True)
+        subprocess.run(git + ["add", "-A"], cwd=path, check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "Generated"], cwd=path, check=True)
+
+
+def bench_size(num_files: int, repeat: int, with_git: bool, targeted: bool) -> Dict:
+    """Run every benchmark against one generated repo size"""
+    results = {}
+    root = tempfile.mkdtemp(prefix=f"lc-bench-{num_files}-")
+    
+    try:
+        start = time.perf_counter()
+        generate_repo(root, num_files, with_git)
+        print(f"  Generated {num_files} files in {time.perf_counter() - start:.1f}s")
+        
+        fm = FileManager(root)
+        
+        results["get_existing_solutions"] = time_call(fm.get_existing_solutions, repeat)
+        results["sanitize_filename"] = time_call(
+            lambda: fm.sanitize_filename("Longest Substring: Without <Repeating> Characters?"),
+            repeat * 100
+        )
+        results["generate_header_comment"] = time_call(
+            lambda: fm.generate_header_comment(
+                problem_id="1",
+                title="Two Sum",
+                difficulty="Easy",
+                url="https://leetcode.com/problems/two-sum/",
+                topics=["Array", "Hash Table"],
+                language="python3",
+                runtime="40 ms",
+                memory="14.2 MB"
+            ),
+            repeat * 100
+        )
+        results["clean_html_content"] = time_call(
+            lambda: fm.clean_html_content(SAMPLE_HTML), repeat * 10
+        )
+        
+        # Each save writes a new file in a language the generator doesn't use
+        next_id = [0]
+        
+        def save():
+            problem_id = str(next_id[0] % MAX_PROBLEM_ID + 1)
+            next_id[0] += 1
+            return fm.save_solution(
+                code=SAMPLE_CODE,
+                problem_id=problem_id,
+                title=f"Problem {problem_id}",
+                title_slug=f"problem-{problem_id}",
+                difficulty="Medium",
+                extension=SAVE_EXTENSION,
+                language="kotlin",
+                topics=["Array"],
+                runtime="40 ms",
+                memory="14.2 MB"
+            )
+        
+        saved = []
+        results["save_solution"] = time_call(lambda: saved.append(save()), repeat)
+        
+        # Otherwise the first non-targeted commit_all sample would also
+        # commit the files left by the save benchmark
+        for path in saved:
+            os.remove(path)
+        
+        if with_git:
+            git = GitHandler(root, targeted=targeted)
+            git.run_git_command(["config", "user.name", "bench"])
+            git.run_git_command(["config", "user.email", "bench@localhost"])
+            if targeted:
+                git.enable_fast_status()
+            
+            def commit_file():
+                path = save()
+                return git.commit_file(path, f"Add {os.path.basename(path)}")
+            
+            def commit_all():
+                path = save()
+                paths = [path] if targeted else None
+                return git.commit_all(f"Add {os.path.basename(path)}", paths)
+            
+            results["commit_file"] = time_call(commit_file, repeat)
+            results["commit_all"] = time_call(commit_all, repeat)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    
+    return results
+
+
+def compare(baseline: Dict, current: Dict) -> None:
+    """Print median changes between two result files"""
+    print()
+    print(f"{'size':>7}  {'benchmark':<26} {'base ms':>10} {'now ms':>10} {'change':>8}")
+    
+    for size, benchmarks in current["results"].items():
+        base_benchmarks = baseline.get("results", {}).get(size, {})
+        for name, stats in benchmarks.items():
+            base = base_benchmarks.get(name)
+            if not base:
+                continue
+            before, after = base["median_ms"], stats["median_ms"]
+            change = (after - before) / before * 100 if before else 0.0
+            print(f"{size:>7}  {name:<26} {before:>10.3f} {after:>10.3f} {change:>+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark FileManager and GitHandler on generated repos"
+    )
+    
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000,50000",
+        help="Comma-separated repo sizes in files (default: 1000,10000,50000)"
+    )
+    
+    parser.add_argument(
+        "--repeat", "-r",
+        type=int,
+        default=5,
+        help="Repetitions per benchmark (default: 5)"
+    )
+    
+    parser.add_argument(
+        "--output", "-o",
+        default="bench_results.json",
+        help="Where to write JSON results (default: bench_results.json)"
+    )
+    
+    parser.add_argument(
+        "--compare",
+        metavar="FILE",
+        help="Previous results file to compare against"
+    )
+    
+    parser.add_argument(
+        "--no-git",
+        action="store_true",
+        help="Skip the GitHandler benchmarks"
+    )
+    
+    parser.add_argument(
+        "--targeted",
+        action="store_true",
+        help="Benchmark GitHandler in targeted mode"
+    )
+    
+    args = parser.parse_args()
+    sizes: List[int] = [int(size) for size in args.sizes.split(",") if size]
+    if any(size > MAX_FILES for size in sizes):
+        print(f"Error: sizes can be at most {MAX_FILES} files")
+        sys.exit(1)
+    
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True
+    ).stdout.strip()
+    
+    report = {
+        "commit": commit,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "targeted": args.targeted,
+        "results": {},
+    }
+    
+    for size in sizes:
+        print(f"Benchmarking {size} files...")
+        report["results"][str(size)] = bench_size(
+            size, args.repeat, with_git=not args.no_git, targeted=args.targeted
+        )
+    
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results written to {args.output}")
+    
+    if args.compare:
+        try:
+            with open(args.compare, "r") as f:
+                compare(json.load(f), report)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error reading {args.compare}: {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,11 +24,8 @@ class FileManager:
         self.base_path = os.path.abspath(base_path)
         self.organize_by = organize_by
         
-        # Create base directories
-        os.makedirs(self.base_path, exist_ok=True)
-        if organize_by == "difficulty":
-            for difficulty in ["Easy", "Medium", "Hard"]:
-                os.makedirs(os.path.join(self.base_path, difficulty), exist_ok=True)
+        # Directories are created on first save, so dry runs and no-op
+        # syncs leave the filesystem untouched
     
     def sanitize_filename(self, name: str) -> str:
         """Convert problem title to valid filename"""
@@ -142,7 +139,8 @@ class FileManager:
         topics: list = None,
         runtime: str = "",
         memory: str = "",
-        include_header: bool = True
+        include_header: bool = True,
+        overwrite: bool = False
     ) -> Optional[str]:
         """
         Save a solution to file
@@ -153,9 +151,11 @@ class FileManager:
             file_path = self.get_solution_path(problem_id, title, difficulty, extension)
             
             # Check if file already exists (skip if exists)
-            if os.path.exists(file_path):
+            if os.path.exists(file_path) and not overwrite:
                 return None
             
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            
             # Generate content
             content = ""
             if include_header:
@@ -188,17 +188,29 @@ class FileManager:
             return None
     
     def get_existing_solutions(self) -> set:
-        """Get set of existing solution filenames (without extension)"""
-        existing = set()
-        
-        for root, dirs, files in os.walk(self.base_path):
-            for file in files:
-                # Extract problem ID from filename
-                match = re.match(r'^(\d{4})-', file)
-                if match:
-                    existing.add(match.group(1))
-        
-        return existing
+        """Get set of existing problem IDs (zero-padded)"""
+        return set(self.get_solution_index())
+    
+    def get_solution_index(self) -> Dict[str, str]:
+        """Get mapping of problem ID (zero-padded) to solution file path"""
+        index = {}
+        pending = [self.base_path]
+        
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            pending.append(entry.path)
+                    elif entry.name[:4].isdigit() and entry.name[4:5] == "-":
+                        index.setdefault(entry.name[:4], entry.path)
+        
+        return index
 
 
 if __name__ == "__main__":
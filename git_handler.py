@@ -5,23 +5,35 @@ Manages Git operations for committing and pushing solutions
 
 import os
 import subprocess
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 
 class GitHandler:
     """Handles all Git operations"""
     
-    def __init__(self, repo_path: str):
-        """Initialize with repository path"""
+    def __init__(self, repo_path: str, targeted: bool = False, enclosing_repo: bool = False):
+        """
+        Initialize with repository path
+        
+        Args:
+            repo_path: Root of the solutions repository
+            targeted: Only ever touch explicitly listed paths (no `add -A`,
+                no full `git status`), for repos with tens of thousands of files
+            enclosing_repo: repo_path may be a folder inside a repository
+                (e.g. a CI checkout) instead of a repository of its own
+        """
         self.repo_path = os.path.abspath(repo_path)
+        self.targeted = targeted
+        self.enclosing_repo = enclosing_repo
     
-    def run_git_command(self, args: list, cwd: str = None) -> Tuple[bool, str]:
+    def run_git_command(self, args: list, cwd: str = None, input_text: str = None) -> Tuple[bool, str]:
         """Run a git command and return success status and output"""
         try:
             result = subprocess.run(
                 ["git"] + args,
                 cwd=cwd or self.repo_path,
+                input=input_text,
                 capture_output=True,
                 text=True
             )
@@ -31,9 +43,31 @@ class GitHandler:
     
     def is_git_repo(self) -> bool:
         """Check if the path is a git repository"""
+        if self.enclosing_repo and os.path.isdir(self.repo_path):
+            success, output = self.run_git_command(["rev-parse", "--is-inside-work-tree"])
+            return success and output.strip() == "true"
+        
         git_dir = os.path.join(self.repo_path, ".git")
         return os.path.isdir(git_dir)
     
+    def enable_fast_status(self) -> None:
+        """Enable the untracked cache and fsmonitor when git supports them"""
+        self.run_git_command(["config", "core.untrackedCache", "true"])
+        
+        # The builtin fsmonitor daemon is only available on some platforms
+        # and git versions; a supported but idle daemon reports "not watching"
+        success, output = self.run_git_command(["fsmonitor--daemon", "status"])
+        if success or "not watching" in output:
+            self.run_git_command(["config", "core.fsmonitor", "true"])
+    
+    def _relative_paths(self, paths: List[str]) -> List[str]:
+        """Convert file paths to paths relative to the repo root"""
+        return [os.path.relpath(path, self.repo_path) for path in paths]
+    
+    def _pathspec_input(self, rel_paths: List[str]) -> str:
+        """Build NUL-separated pathspec input for --pathspec-from-file"""
+        return "\0".join(rel_paths) + "\0"
+    
     def init_repo(self) -> bool:
         """Initialize a new git repository"""
         if self.is_git_repo():
@@ -85,6 +119,9 @@ class GitHandler:
     
     def commit_file(self, file_path: str, message: str) -> bool:
         """Stage and commit a single file"""
+        if self.targeted:
+            return self.commit_paths([file_path], message)
+        
         # Get relative path from repo root
         rel_path = os.path.relpath(file_path, self.repo_path)
         
@@ -111,8 +148,63 @@ class GitHandler:
         
         return success
     
-    def commit_all(self, message: str) -> bool:
-        """Stage and commit all changes"""
+    def commit_paths(self, paths: List[str], message: str) -> bool:
+        """
+        Stage and commit exactly the given files
+        
+        Only the listed paths are staged, compared and committed, so the
+        cost depends on the number of files rather than the size of the repo.
+        """
+        if not paths:
+            return True
+        
+        pathspec = self._pathspec_input(self._relative_paths(paths))
+        pathspec_args = ["--pathspec-from-file=-", "--pathspec-file-nul"]
+        
+        # Stage the files
+        success, output = self.run_git_command(["add"] + pathspec_args, input_text=pathspec)
+        if not success:
+            print(f"✗ Failed to stage {len(paths)} file(s): {output}")
+            return False
+        
+        # Commit only these paths, leaving the rest of the index alone
+        success, output = self.run_git_command(
+            ["commit", "--untracked-files=no", "-m", message] + pathspec_args,
+            input_text=pathspec
+        )
+        if success:
+            print(f"✓ Committed: {message}")
+        else:
+            if "nothing to commit" in output or "no changes added" in output:
+                return True
+            print(f"✗ Failed to commit: {output}")
+        
+        return success
+    
+    def commit_all(self, message: str, paths: Optional[List[str]] = None) -> bool:
+        """
+        Stage and commit all changes
+        
+        If paths are given, only those files are staged. In targeted mode
+        without paths, only what is already staged is committed.
+        """
+        if paths is not None:
+            return self.commit_paths(paths, message)
+        
+        if self.targeted:
+            # Index vs HEAD only, no working tree scan
+            success, output = self.run_git_command(["diff", "--cached", "--quiet"])
+            if success:
+                print("No changes to commit")
+                return True
+            
+            success, output = self.run_git_command(["commit", "--untracked-files=no", "-m", message])
+            if success:
+                print(f"✓ Committed: {message}")
+            else:
+                print(f"✗ Failed to commit: {output}")
+            return success
+        
         # Stage all changes
         success, output = self.run_git_command(["add", "-A"])
         if not success:
@@ -136,8 +228,10 @@ class GitHandler:
     
     def push(self, remote: str = "origin", branch: str = "main") -> bool:
         """Push commits to remote"""
-        # First, ensure we have the branch set up
-        success, output = self.run_git_command(["branch", "-M", branch])
+        # First, ensure we have the branch set up (skip if already on it)
+        success, output = self.run_git_command(["symbolic-ref", "--short", "HEAD"])
+        if not success or output.strip() != branch:
+            self.run_git_command(["branch", "-M", branch])
         
         # Push to remote
         success, output = self.run_git_command(["push", "-u", remote, branch])
@@ -158,9 +252,54 @@ class GitHandler:
         
         return success
     
-    def get_status(self) -> str:
-        """Get current git status"""
-        success, output = self.run_git_command(["status", "--short"])
+    def is_shallow(self) -> bool:
+        """Check if the repository is a shallow clone"""
+        success, output = self.run_git_command(["rev-parse", "--is-shallow-repository"])
+        return success and output.strip() == "true"
+    
+    def get_commit_times(self, paths: List[str], batch_size: int = 500) -> Dict[str, int]:
+        """
+        Get the time of the last commit touching each of the given files,
+        keyed by absolute path
+        
+        The history walk is limited to those files (in batches, to keep the
+        command line short).
+        """
+        rel_paths = self._relative_paths(paths)
+        times = {}
+        
+        for i in range(0, len(rel_paths), batch_size):
+            success, output = self.run_git_command(
+                ["-c", "core.quotePath=false", "log", "--format=%x00%ct", "--name-only",
+                 "--no-renames", "--relative", "--"] + rel_paths[i:i + batch_size]
+            )
+            if not success:
+                continue
+            
+            for chunk in output.split("\0")[1:]:
+                lines = chunk.strip().splitlines()
+                if not lines or not lines[0].isdigit():
+                    continue
+                for name in lines[1:]:
+                    if name:
+                        times.setdefault(os.path.abspath(os.path.join(self.repo_path, name)), int(lines[0]))
+        
+        return times
+    
+    def get_status(self, paths: Optional[List[str]] = None) -> str:
+        """
+        Get current git status
+        
+        In targeted mode untracked files are not scanned, and passing paths
+        limits the status to those files.
+        """
+        args = ["status", "--short"]
+        if self.targeted:
+            args.append("--untracked-files=no")
+        if paths:
+            args += ["--"] + self._relative_paths(paths)
+        
+        success, output = self.run_git_command(args)
         return output if success else "Unable to get status"
 
 
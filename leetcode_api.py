@@ -3,10 +3,15 @@ LeetCode API Handler
 Fetches submissions and problem details using LeetCode's GraphQL API
 """
 
-import requests
+import heapq
 import json
 import time
-from typing import Optional, Dict, List, Any
+from collections import deque
+from typing import TYPE_CHECKING, Optional, Dict, List, Any, Iterator
+
+if TYPE_CHECKING:
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
 
 
 class LeetCodeAPI:
@@ -26,6 +31,7 @@ class LeetCodeAPI:
         "javascript": ".js",
         "typescript": ".ts",
         "go": ".go",
+        "golang": ".go",
         "ruby": ".rb",
         "swift": ".swift",
         "kotlin": ".kt",
@@ -38,8 +44,67 @@ class LeetCodeAPI:
         "oraclesql": ".sql",
     }
     
-    def __init__(self, session_cookie: str, csrf_token: str = ""):
-        """Initialize with LeetCode session cookie"""
+    # Common names for languages whose LeetCode name differs
+    LANGUAGE_ALIASES = {
+        "go": "golang",
+        "c++": "cpp",
+        "c#": "csharp",
+        "js": "javascript",
+        "ts": "typescript",
+    }
+    
+    # (connect, read) timeouts in seconds per GraphQL operation
+    DEFAULT_TIMEOUTS = {
+        "default": (5, 30),
+        "userStatus": (5, 15),
+        "submissionList": (5, 30),
+        "submissionDetails": (5, 20),
+        "question": (5, 20),
+        "questionList": (5, 60),
+    }
+    
+    # Idempotent reads that may be duplicated when they run long
+    HEDGED_OPERATIONS = {"submissionDetails", "question"}
+    
+    # Latency samples needed before a p95 is trusted for hedging
+    MIN_HEDGE_SAMPLES = 20
+    
+    def __init__(
+        self,
+        session_cookie: str,
+        csrf_token: str = "",
+        timeouts: Optional[Dict[str, List[float]]] = None,
+        hedge: bool = False,
+        hedge_budget: float = 0.1
+    ):
+        """
+        Initialize with LeetCode session cookie
+        
+        Args:
+            session_cookie: LEETCODE_SESSION cookie value
+            csrf_token: Optional csrftoken cookie value
+            timeouts: Per-operation [connect, read] timeout overrides
+            hedge: Send a duplicate of slow idempotent reads once they run
+                past their p95 latency, and use whichever answers first
+            hedge_budget: Max extra hedged requests, as a fraction of all
+                hedgeable requests
+        """
+        self.timeouts = dict(self.DEFAULT_TIMEOUTS)
+        for operation, timeout in (timeouts or {}).items():
+            self.timeouts[operation] = tuple(timeout)
+        
+        self.hedge = hedge
+        self.hedge_budget = hedge_budget
+        self.hedgeable_requests = 0
+        self.hedged_requests = 0
+        self.latencies: Dict[str, deque] = {}
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        self._language_ids: Optional[Dict[str, int]] = None
+        
+        # Imported here so loading this module stays cheap for runs that
+        # never reach the network
+        import requests
+        
         self.session = requests.Session()
         self.session.cookies.set("LEETCODE_SESSION", session_cookie, domain=".leetcode.com")
         if csrf_token:
@@ -55,6 +120,65 @@ class LeetCodeAPI:
         if csrf_token:
             self.session.headers["x-csrftoken"] = csrf_token
     
+    def _timed_post(self, operation: str, payload: Dict) -> "requests.Response":
+        """POST a GraphQL payload with the operation's deadlines, recording latency"""
+        timeout = self.timeouts.get(operation, self.timeouts["default"])
+        
+        start = time.monotonic()
+        response = self.session.post(self.GRAPHQL_URL, json=payload, timeout=timeout)
+        self.latencies.setdefault(operation, deque(maxlen=200)).append(time.monotonic() - start)
+        
+        return response
+    
+    def _p95(self, operation: str) -> Optional[float]:
+        """p95 latency of an operation, or None until enough samples exist"""
+        samples = self.latencies.get(operation)
+        if not samples or len(samples) < self.MIN_HEDGE_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[int(len(ordered) * 0.95) - 1]
+    
+    def _hedged_post(self, operation: str, payload: Dict) -> "requests.Response":
+        """
+        POST with a hedge: if the request is slower than its p95, send a
+        duplicate and return whichever succeeds first
+        """
+        from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+        
+        self.hedgeable_requests += 1
+        delay = self._p95(operation)
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4)
+        
+        primary = self._executor.submit(self._timed_post, operation, payload)
+        
+        within_budget = self.hedged_requests < self.hedge_budget * self.hedgeable_requests
+        if delay is None or not within_budget:
+            return primary.result()
+        
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        
+        self.hedged_requests += 1
+        pending = {primary, self._executor.submit(self._timed_post, operation, payload)}
+        
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [future for future in done if future.exception() is None]
+            if succeeded:
+                return succeeded[0].result()
+            if not pending:
+                # Both failed, surface the error
+                return done.pop().result()
+    
+    def _post(self, operation: str, payload: Dict) -> "requests.Response":
+        """POST a GraphQL payload, hedging idempotent reads when enabled"""
+        if self.hedge and operation in self.HEDGED_OPERATIONS:
+            return self._hedged_post(operation, payload)
+        return self._timed_post(operation, payload)
+    
     def get_user_profile(self) -> Optional[Dict]:
         """Get current user's profile to verify authentication"""
         query = """
@@ -68,9 +192,9 @@ class LeetCodeAPI:
         """
         
         try:
-            response = self.session.post(
-                self.GRAPHQL_URL,
-                json={"query": query}
+            response = self._post(
+                "userStatus",
+                {"query": query}
             )
             data = response.json()
             return data.get("data", {}).get("userStatus")
@@ -78,8 +202,19 @@ class LeetCodeAPI:
             print(f"Error fetching profile: {e}")
             return None
     
-    def get_all_submissions(self, limit: int = 20, offset: int = 0) -> List[Dict]:
-        """Fetch user's submission history"""
+    def get_submission_page(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        last_key: str = None,
+        question_slug: str = None,
+        lang_id: int = None
+    ) -> Optional[Dict]:
+        """
+        Fetch one page of accepted submissions (submissions, hasNext, lastKey)
+        
+        question_slug and lang_id are filtered server-side.
+        """
         query = """
         query submissionList($offset: Int!, $limit: Int!, $lastKey: String, $questionSlug: String, $lang: Int, $status: Int) {
             submissionList(offset: $offset, limit: $limit, lastKey: $lastKey, questionSlug: $questionSlug, lang: $lang, status: $status) {
@@ -102,23 +237,159 @@ class LeetCodeAPI:
         """
         
         try:
-            response = self.session.post(
-                self.GRAPHQL_URL,
-                json={
+            response = self._post(
+                "submissionList",
+                {
                     "query": query,
                     "variables": {
                         "offset": offset,
                         "limit": limit,
+                        "lastKey": last_key,
+                        "questionSlug": question_slug,
+                        "lang": lang_id,
                         "status": 10  # 10 = Accepted submissions only
                     }
                 }
             )
             data = response.json()
-            submission_list = data.get("data", {}).get("submissionList", {})
-            return submission_list.get("submissions", [])
+            return data.get("data", {}).get("submissionList")
         except Exception as e:
             print(f"Error fetching submissions: {e}")
-            return []
+            return None
+    
+    def get_all_submissions(self, limit: int = 20, offset: int = 0) -> List[Dict]:
+        """Fetch user's submission history"""
+        submission_list = self.get_submission_page(limit=limit, offset=offset) or {}
+        return submission_list.get("submissions") or []
+    
+    def get_language_ids(self) -> Dict[str, int]:
+        """Get mapping of language name to the id used by submissionList"""
+        if self._language_ids is not None:
+            return self._language_ids
+        
+        query = """
+        query languageList {
+            languageList {
+                id
+                name
+            }
+        }
+        """
+        
+        try:
+            response = self._post("languageList", {"query": query})
+            data = response.json()
+            languages = data.get("data", {}).get("languageList") or []
+            self._language_ids = {lang["name"].lower(): int(lang["id"]) for lang in languages}
+        except Exception as e:
+            print(f"Error fetching language list: {e}")
+            return {}
+        
+        return self._language_ids
+    
+    def _iter_submission_pages(
+        self,
+        page_size: int,
+        question_slug: str = None,
+        lang_id: int = None
+    ) -> Iterator[Dict]:
+        """Stream one server-side filtered listing, newest first"""
+        offset = 0
+        last_key = None
+        
+        while True:
+            page = self.get_submission_page(
+                limit=page_size,
+                offset=offset,
+                last_key=last_key,
+                question_slug=question_slug,
+                lang_id=lang_id
+            )
+            if not page:
+                return
+            
+            submissions = page.get("submissions") or []
+            yield from submissions
+            
+            if not page.get("hasNext") or not submissions:
+                return
+            
+            offset += len(submissions)
+            last_key = page.get("lastKey")
+            time.sleep(0.5)  # Rate limiting
+    
+    def iter_accepted_submissions(
+        self,
+        page_size: int = 100,
+        langs: Optional[List[str]] = None,
+        slugs: Optional[List[str]] = None,
+        after: Optional[int] = None,
+        before: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream the accepted-submission listing page by page, newest first
+        
+        Args:
+            page_size: Submissions per request
+            langs: Only these languages (server-side when the id is known)
+            slugs: Only these problems (one server-side listing per slug)
+            after: Stop once submissions are older than this unix timestamp
+            before: Skip submissions newer than this unix timestamp
+        """
+        langs = [self.LANGUAGE_ALIASES.get(lang.lower(), lang.lower()) for lang in langs or []]
+        
+        # Languages without a known id are filtered client-side
+        lang_ids = self.get_language_ids() if langs else {}
+        server_langs = [lang_ids[lang] for lang in langs if lang in lang_ids]
+        client_langs = set(lang for lang in langs if lang not in lang_ids)
+        
+        lang_filters: List[Optional[int]] = server_langs or [None]
+        if server_langs and client_langs:
+            lang_filters.append(None)
+        
+        # One listing per slug/language combination, merged by time
+        streams = [
+            self._iter_submission_pages(page_size, question_slug=slug, lang_id=lang_id)
+            for slug in (slugs or [None])
+            for lang_id in lang_filters
+        ]
+        merged = streams[0] if len(streams) == 1 else heapq.merge(
+            *streams, key=lambda sub: -int(sub.get("timestamp", 0))
+        )
+        
+        seen = set()
+        for submission in merged:
+            timestamp = int(submission.get("timestamp", 0))
+            if after is not None and timestamp < after:
+                # Listing is time-ordered, nothing older can match
+                return
+            if before is not None and timestamp >= before:
+                continue
+            if langs and submission.get("lang", "").lower() not in langs:
+                continue
+            if submission.get("id") in seen:
+                continue
+            seen.add(submission.get("id"))
+            yield submission
+    
+    def get_submissions_since(
+        self,
+        since: int,
+        page_size: int = 100,
+        filters: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Fetch every accepted submission at or after a unix timestamp
+        
+        Every submission in the window has to be downloaded anyway, so the
+        listing is walked page by page and stops at the first page that
+        reaches past the window; locating the boundary first would only add
+        requests.
+        """
+        filters = {key: value for key, value in (filters or {}).items() if key != "after"}
+        submissions = list(self.iter_accepted_submissions(page_size, after=since, **filters))
+        print(f"  {len(submissions)} submissions in window")
+        return submissions
     
     def get_todays_submissions(self) -> List[Dict]:
         """Fetch only today's accepted submissions"""
@@ -126,84 +397,103 @@ class LeetCodeAPI:
         
         # Get today's date at midnight (UTC)
         today = datetime.now(timezone.utc).date()
+        midnight = datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
         
         print(f"Fetching today's submissions ({today})...")
         
-        # Fetch recent submissions
-        submissions = self.get_all_submissions(limit=50, offset=0)
-        
-        todays_subs = []
-        for sub in submissions:
-            # Convert timestamp to date
-            timestamp = int(sub.get("timestamp", 0))
-            sub_date = datetime.fromtimestamp(timestamp, timezone.utc).date()
-            
-            if sub_date == today:
-                todays_subs.append(sub)
-            elif sub_date < today:
-                # Stop if we've gone past today (submissions are ordered by time)
-                break
+        todays_subs = self.get_submissions_since(int(midnight.timestamp()))
         
         print(f"  Found {len(todays_subs)} submissions from today")
         return todays_subs
     
-    def get_all_accepted_submissions(self, max_submissions: int = 500, today_only: bool = False) -> List[Dict]:
-        """Fetch accepted submissions with pagination"""
+    def get_all_accepted_submissions(
+        self,
+        max_submissions: int = 500,
+        today_only: bool = False,
+        filters: Optional[Dict] = None,
+        since: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Fetch accepted submissions with pagination
+        
+        filters may contain "langs", "slugs", "after" and "before" (see
+        iter_accepted_submissions); they are pushed into the query where
+        the API supports it and end pagination early otherwise.
+        
+        With today_only or since, the whole time window is fetched and
+        max_submissions does not apply.
+        """
+        from datetime import datetime, timezone
+        
         if today_only:
-            return self.get_todays_submissions()
+            if not filters and since is None:
+                return self.get_todays_submissions()
+            
+            midnight = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+            since = max(since or 0, int(midnight.timestamp()))
+        
+        if since is not None:
+            since = max(since, (filters or {}).get("after") or 0)
+            window_start = datetime.fromtimestamp(since, timezone.utc)
+            print(f"Fetching submissions since {window_start:%Y-%m-%d %H:%M} UTC...")
+            
+            submissions = self.get_submissions_since(since, filters=filters)
+            print(f"  Found {len(submissions)} submissions")
+            return submissions
         
         all_submissions = []
-        offset = 0
-        limit = 20
         
         print("Fetching your accepted submissions...")
         
-        while len(all_submissions) < max_submissions:
-            submissions = self.get_all_submissions(limit=limit, offset=offset)
-            
-            if not submissions:
+        for submission in self.iter_accepted_submissions(page_size=20, **(filters or {})):
+            all_submissions.append(submission)
+            if len(all_submissions) % 20 == 0:
+                print(f"  Fetched {len(all_submissions)} submissions...")
+            if len(all_submissions) >= max_submissions:
                 break
-                
-            all_submissions.extend(submissions)
-            print(f"  Fetched {len(all_submissions)} submissions...")
-            
-            if len(submissions) < limit:
-                break
-                
-            offset += limit
-            time.sleep(0.5)  # Rate limiting
         
-        return all_submissions[:max_submissions]
+        return all_submissions
     
-    def get_submission_code(self, submission_id: str) -> Optional[str]:
-        """Get the actual code from a submission"""
+    def get_submission_code(self, submission_id: str, include_question: bool = True) -> Optional[Dict]:
+        """
+        Get the actual code from a submission
+        
+        Args:
+            submission_id: Submission to fetch
+            include_question: Also fetch the problem metadata. Pass False when
+                the problem is already known from the catalog snapshot.
+        """
+        question_fields = """
+                question {
+                    questionId
+                    title
+                    titleSlug
+                    difficulty
+                    topicTags {
+                        name
+                    }
+                }""" if include_question else ""
+        
         query = """
         query submissionDetails($submissionId: Int!) {
             submissionDetails(submissionId: $submissionId) {
                 code
                 timestamp
                 statusDisplay
+                runtimeDisplay
+                memoryDisplay
                 lang {
                     name
                     verboseName
-                }
-                question {
-                    questionId
-                    title
-                    titleSlug
-                    difficulty
-                    topicTags {
-                        name
-                    }
-                }
+                }%s
             }
         }
-        """
+        """ % question_fields
         
         try:
-            response = self.session.post(
-                self.GRAPHQL_URL,
-                json={
+            response = self._post(
+                "submissionDetails",
+                {
                     "query": query,
                     "variables": {"submissionId": int(submission_id)}
                 }
@@ -239,9 +529,9 @@ class LeetCodeAPI:
         """
         
         try:
-            response = self.session.post(
-                self.GRAPHQL_URL,
-                json={
+            response = self._post(
+                "question",
+                {
                     "query": query,
                     "variables": {"titleSlug": title_slug}
                 }
@@ -252,21 +542,86 @@ class LeetCodeAPI:
             print(f"Error fetching problem details: {e}")
             return None
     
+    def get_problem_catalog_page(self, limit: int = 1000, skip: int = 0) -> Optional[Dict]:
+        """Fetch one page of the problem set metadata (id, difficulty, topics)"""
+        query = """
+        query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
+            problemsetQuestionList: questionList(categorySlug: $categorySlug, limit: $limit, skip: $skip, filters: $filters) {
+                total: totalNum
+                questions: data {
+                    questionId
+                    questionFrontendId
+                    title
+                    titleSlug
+                    difficulty
+                    topicTags {
+                        name
+                        slug
+                    }
+                }
+            }
+        }
+        """
+        
+        try:
+            response = self._post(
+                "questionList",
+                {
+                    "query": query,
+                    "variables": {
+                        "categorySlug": "",
+                        "limit": limit,
+                        "skip": skip,
+                        "filters": {}
+                    }
+                }
+            )
+            data = response.json()
+            return data.get("data", {}).get("problemsetQuestionList")
+        except Exception as e:
+            print(f"Error fetching problem catalog: {e}")
+            return None
+    
+    def get_problem_catalog(self, page_size: int = 1000) -> Optional[List[Dict]]:
+        """
+        Fetch metadata for the whole problem set in a few large pages
+        
+        Returns None if any page fails, so a partial catalog is never stored.
+        """
+        questions = []
+        skip = 0
+        
+        while True:
+            page = self.get_problem_catalog_page(limit=page_size, skip=skip)
+            if not page:
+                return None
+            
+            batch = page.get("questions") or []
+            questions.extend(batch)
+            
+            total = page.get("total") or 0
+            if not batch or len(questions) >= total:
+                break
+            
+            skip += len(batch)
+            time.sleep(0.5)  # Rate limiting
+        
+        return questions
+    
     def get_extension(self, language: str) -> str:
         """Get file extension for a language"""
         return self.LANGUAGE_EXTENSIONS.get(language.lower(), ".txt")
 
 
-def test_connection():
-    """Test the API connection"""
-    import json
-    
-    try:
-        with open("config.json", "r") as f:
-            config = json.load(f)
-    except FileNotFoundError:
-        print("Error: config.json not found!")
-        return
+def test_connection(config: Optional[Dict] = None):
+    """Test the API connection (loads config.json if no config is given)"""
+    if config is None:
+        try:
+            with open("config.json", "r") as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            print("Error: config.json not found!")
+            return
     
     if not config.get("leetcode_session"):
         print("Error: leetcode_session not set in config.json")
@@ -274,7 +629,8 @@ def test_connection():
     
     api = LeetCodeAPI(
         config["leetcode_session"],
-        config.get("csrf_token", "")
+        config.get("csrf_token", ""),
+        timeouts=config.get("request_timeouts")
     )
     
     print("Testing LeetCode API connection...")
@@ -3,16 +3,43 @@ LeetCode to GitHub Sync
 Main script to sync LeetCode submissions to your GitHub repository
 """
 
+import time
+
+STARTED_AT = time.perf_counter()
+
 import json
 import os
 import sys
 import argparse
-import time
-from datetime import datetime
+import importlib
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from leetcode_api import LeetCodeAPI
+    from problem_catalog import ProblemCatalog
+
+# Seconds spent importing each lazily loaded module (see --timings)
+IMPORT_TIMES: Dict[str, float] = {}
+
 
-from leetcode_api import LeetCodeAPI
-from git_handler import GitHandler
-from file_manager import FileManager
+def lazy_import(module_name: str):
+    """Import a module on first use, recording how long the import took"""
+    module = sys.modules.get(module_name)
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        IMPORT_TIMES[module_name] = time.perf_counter() - start
+    return module
+
+
+def report_timings() -> None:
+    """Print import and total run time"""
+    print()
+    print("Timings:")
+    for module_name, seconds in IMPORT_TIMES.items():
+        print(f"  import {module_name:<16} {seconds * 1000:8.1f} ms")
+    print(f"  total {' ' * 17}{(time.perf_counter() - STARTED_AT) * 1000:8.1f} ms")
 
 
 def load_config(config_path: str = "config.json") -> dict:
@@ -29,23 +56,68 @@ def load_config(config_path: str = "config.json") -> dict:
         sys.exit(1)
 
 
-def sync_submissions(
-    config: dict,
-    max_submissions: int = 100,
-    dry_run: bool = False,
-    force: bool = False,
-    today_only: bool = False
-):
+def parse_date(value: str) -> int:
+    """Convert a YYYY-MM-DD date (UTC midnight) to a unix timestamp"""
+    try:
+        date = datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except ValueError:
+        print(f"Error: invalid date '{value}', expected YYYY-MM-DD")
+        sys.exit(1)
+    return int(date.timestamp())
+
+
+def build_filters(args: argparse.Namespace, config: dict) -> dict:
     """
-    Main sync function
+    Collect submission filters from the CLI, falling back to config
     
-    Args:
-        config: Configuration dictionary
-        max_submissions: Maximum number of submissions to sync
-        dry_run: If True, don't actually save files or commit
-        force: If True, overwrite existing files
+    Returns keyword arguments for LeetCodeAPI.iter_accepted_submissions
     """
-    # Validate config
+    filters = {}
+    
+    langs = args.lang or config.get("filter_langs")
+    if langs:
+        filters["langs"] = langs
+    
+    slugs = args.slug or config.get("filter_slugs")
+    if slugs:
+        filters["slugs"] = slugs
+    
+    after = args.after or config.get("filter_after")
+    if after:
+        filters["after"] = parse_date(after)
+    
+    before = args.before or config.get("filter_before")
+    if before:
+        # Inclusive end date
+        filters["before"] = parse_date(before) + 24 * 3600
+    
+    return filters
+
+
+def resolve_since(args: argparse.Namespace, config: dict) -> Optional[int]:
+    """
+    Get the start of the --since/--days window as a unix timestamp
+    
+    `--since last` resumes from the newest submission a previous run synced.
+    """
+    if args.since == "last":
+        SyncState = lazy_import("sync_state").SyncState
+        state = SyncState(config.get("state_path", ".sync_state.json"))
+        if state.load() and state.watermark:
+            synced_at = datetime.fromtimestamp(state.watermark, timezone.utc)
+            print(f"Syncing since the last synced submission ({synced_at:%Y-%m-%d %H:%M} UTC)")
+            return state.watermark
+        print("No previous sync recorded, syncing the latest submissions")
+        return None
+    if args.since:
+        return parse_date(args.since)
+    if args.days:
+        return int(time.time()) - args.days * 24 * 3600
+    return None
+
+
+def validate_config(config: dict) -> bool:
+    """Check that the session cookie is configured"""
     if not config.get("leetcode_session"):
         print("Error: leetcode_session not set in config.json")
         print("\nTo get your session cookie:")
@@ -53,49 +125,586 @@ def sync_submissions(
         print("2. Open Developer Tools (F12)")
         print("3. Go to Application > Cookies > leetcode.com")
         print("4. Copy the value of 'LEETCODE_SESSION'")
-        return
-    
-    # Initialize components
-    api = LeetCodeAPI(
+        return False
+    return True
+
+
+def create_api(config: dict) -> "LeetCodeAPI":
+    """Create the API client with the configured deadlines and hedging"""
+    LeetCodeAPI = lazy_import("leetcode_api").LeetCodeAPI
+    return LeetCodeAPI(
         config["leetcode_session"],
-        config.get("csrf_token", "")
+        config.get("csrf_token", ""),
+        timeouts=config.get("request_timeouts"),
+        hedge=config.get("hedge_requests", False),
+        hedge_budget=config.get("hedge_budget", 0.1)
     )
-    
-    repo_path = config.get("github_repo_path", "./solutions")
-    
-    file_manager = FileManager(
-        repo_path,
-        config.get("organize_by", "difficulty")
-    )
-    
-    git_handler = GitHandler(repo_path)
-    
-    # Verify authentication
+
+
+def authenticate(api: "LeetCodeAPI", heading: str = "LeetCode to GitHub Sync") -> bool:
+    """Print the banner and verify the session is signed in"""
     print("=" * 50)
-    print("LeetCode to GitHub Sync")
+    print(heading)
     print("=" * 50)
     print()
     
     profile = api.get_user_profile()
     if not profile or not profile.get("isSignedIn"):
         print("✗ Not authenticated. Please check your session cookie.")
-        return
+        return False
     
     print(f"✓ Logged in as: {profile.get('username')}")
     print()
+    return True
+
+
+def load_catalog(config: dict, api: "LeetCodeAPI", refresh: bool = False) -> "ProblemCatalog":
+    """Load the problem metadata snapshot (id, difficulty, topics)"""
+    ProblemCatalog = lazy_import("problem_catalog").ProblemCatalog
+    catalog = ProblemCatalog(
+        config.get("catalog_path", ".leetcode_catalog.json"),
+        config.get("catalog_refresh_hours", 168)
+    )
+    catalog.ensure_fresh(api, force=refresh)
+    return catalog
+
+
+class LineOutput:
+    """
+    Stdout wrapper for worker threads: each thread's output is buffered
+    and written out a whole line at a time, so lines don't interleave
+    """
     
-    # Initialize git repo if needed
-    if not dry_run:
-        if not git_handler.is_git_repo():
-            git_handler.init_repo()
+    def __init__(self, stream):
+        import threading
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+    
+    def write(self, text: str) -> int:
+        buffered = getattr(self.local, "buffer", "") + text
+        complete, _, self.local.buffer = buffered.rpartition("\n")
+        if complete:
+            with self.lock:
+                self.stream.write(complete + "\n")
+                self.stream.flush()
+        return len(text)
+    
+    def flush(self) -> None:
+        with self.lock:
+            self.stream.flush()
+
+
+# Keys a target in config["targets"] may override
+TARGET_KEYS = (
+    "github_repo_path",
+    "organize_by",
+    "include_problem_description",
+    "commit_message_template",
+    "update_message_template",
+    "auto_push",
+    "git_targeted_mode",
+    "git_enclosing_repo",
+)
+
+
+def build_targets(config: dict) -> List[dict]:
+    """
+    Build the output targets for a sync
     
-    # Get existing solutions to avoid duplicates
-    existing = file_manager.get_existing_solutions()
-    print(f"Found {len(existing)} existing solutions in repository")
+    Each entry of config["targets"] overrides the top-level settings in
+    TARGET_KEYS. Without "targets", the top-level config is the only target.
+    """
+    FileManager = lazy_import("file_manager").FileManager
+    GitHandler = lazy_import("git_handler").GitHandler
+    SolutionMetrics = lazy_import("solution_metrics").SolutionMetrics
+    
+    target_configs = config.get("targets") or [{}]
+    targets = []
+    repo_paths = {}
+    
+    for i, overrides in enumerate(target_configs, 1):
+        target_config = {key: config[key] for key in TARGET_KEYS if key in config}
+        target_config.update({key: overrides[key] for key in TARGET_KEYS if key in overrides})
+        
+        repo_path = target_config.get("github_repo_path", "./solutions")
+        
+        # Targets are written in parallel, so two sharing a repo would race
+        resolved = os.path.normcase(os.path.realpath(repo_path))
+        if resolved in repo_paths:
+            print(f"Error: targets {repo_paths[resolved]} and {i} both use the repo {repo_path}")
+            sys.exit(1)
+        repo_paths[resolved] = i
+        
+        targets.append({
+            "name": overrides.get("name", repo_path if len(target_configs) > 1 else ""),
+            "config": target_config,
+            "file_manager": FileManager(repo_path, target_config.get("organize_by", "difficulty")),
+            "git_handler": GitHandler(
+                repo_path,
+                targeted=target_config.get("git_targeted_mode", False),
+                enclosing_repo=target_config.get("git_enclosing_repo", False)
+            ),
+            "existing": set(),
+            "index": {},
+            "metrics": SolutionMetrics(repo_path),
+            "new": 0,
+        })
+    
+    return targets
+
+
+def prepare_targets(targets: List[dict], dry_run: bool = False) -> None:
+    """Initialize each target's git repo and index its existing solutions"""
+    for target in targets:
+        git_handler = target["git_handler"]
+        
+        # Initialize git repo if needed
+        if not dry_run:
+            if not git_handler.is_git_repo():
+                git_handler.init_repo()
+            if git_handler.targeted:
+                git_handler.enable_fast_status()
+        
+        # Get existing solutions to avoid duplicates
+        target["index"] = target["file_manager"].get_solution_index()
+        target["existing"] = set(target["index"])
+        target["metrics"].load()
+        label = f" in {target['name']}" if target["name"] else " in repository"
+        print(f"Found {len(target['existing'])} existing solutions{label}")
+        seed_metrics(target, dry_run=dry_run)
     print()
+
+
+def seed_metrics(target: dict, dry_run: bool = False) -> None:
+    """
+    Record metrics for solutions synced before they were kept
+    
+    Numbers come from each file's header and the sync time from its last
+    commit; the result is saved and committed once, so later runs don't
+    read the headers or walk the history again.
+    """
+    metrics = target["metrics"]
+    index = target["index"]
+    undated = [pid for pid in index if not (metrics.get(pid) or {}).get("timestamp")]
+    if not undated:
+        return
+    
+    # File mtimes only tell when the repo was checked out, and in a
+    # shallow clone every file looks committed at the clone boundary
+    git_handler = target["git_handler"]
+    is_repo = git_handler.is_git_repo()
+    commit_times = {}
+    if is_repo and git_handler.is_shallow():
+        print("  Note: shallow clone, sync times of older solutions are unknown "
+              "(run once with full history to record them)")
+    elif is_repo:
+        commit_times = git_handler.get_commit_times([index[pid] for pid in undated])
+    
+    seeded = 0
+    for problem_id in undated:
+        if metrics.get(problem_id) is None:
+            metrics.seed(problem_id, index[problem_id])
+            seeded += 1
+        metrics.set_timestamp(problem_id, commit_times.get(os.path.abspath(index[problem_id])))
+    
+    if not metrics.dirty:
+        return
+    if seeded:
+        print(f"  Recorded metrics for {seeded} existing solutions")
+    if not dry_run and is_repo:
+        commit_metrics(target, "Record metrics for existing solutions")
+
+
+def commit_metrics(target: dict, message: str) -> None:
+    """Save a target's metrics file and commit it, if it changed"""
+    metrics = target["metrics"]
+    if not metrics.dirty:
+        return
+    if metrics.save():
+        target["git_handler"].commit_all(message, paths=[metrics.path])
+
+
+def save_to_target(
+    target: dict,
+    solution: dict,
+    force: bool = False,
+    best_runtime: bool = False
+) -> Optional[str]:
+    """
+    Save and commit one fetched solution into a target
+    
+    In best-runtime mode an existing solution is replaced.
+    """
+    config = target["config"]
+    problem_id = solution["problem_id"]
+    is_update = problem_id.zfill(4) in target["existing"]
+    
+    file_path = target["file_manager"].save_solution(
+        code=solution["code"],
+        problem_id=solution["problem_id"],
+        title=solution["title"],
+        title_slug=solution["title_slug"],
+        difficulty=solution["difficulty"],
+        extension=solution["extension"],
+        language=solution["language"],
+        topics=solution["topics"],
+        runtime=solution["runtime"],
+        memory=solution["memory"],
+        include_header=config.get("include_problem_description", True),
+        overwrite=force or best_runtime
+    )
+    
+    if not file_path:
+        return None
+    
+    removed_paths = []
+    if best_runtime:
+        # A different language means a different file; drop the old one
+        old_path = target["index"].get(problem_id.zfill(4))
+        if old_path and os.path.abspath(old_path) != os.path.abspath(file_path) and os.path.exists(old_path):
+            os.remove(old_path)
+            removed_paths.append(old_path)
+    
+    commit_solution(
+        target, file_path, problem_id, solution["title"], solution["difficulty"],
+        submission_id=solution["submission_id"],
+        timestamp=solution["timestamp"],
+        runtime=solution["runtime"],
+        memory=solution["memory"],
+        is_update=is_update,
+        removed_paths=removed_paths
+    )
+    return file_path
+
+
+def commit_solution(
+    target: dict,
+    file_path: str,
+    problem_id: str,
+    title: str,
+    difficulty: str,
+    submission_id: str = "",
+    timestamp: Optional[int] = None,
+    runtime: str = "",
+    memory: str = "",
+    is_update: bool = False,
+    removed_paths: Optional[List[str]] = None
+) -> None:
+    """
+    Record a saved solution in a target and commit it
+    
+    The submission it came from is stored in the target's metrics file,
+    which is committed together with the solution.
+    """
+    label = f" to {target['name']}" if target["name"] else ""
+    action = "Updated" if is_update else "Saved"
+    print(f"  ✓ {action}{label}: {os.path.basename(file_path)}")
+    target["existing"].add(problem_id.zfill(4))
+    target["index"][problem_id.zfill(4)] = file_path
+    target["new"] += 1
+    
+    metrics = target["metrics"]
+    metrics.record(problem_id, submission_id, runtime, memory, file_path, timestamp)
+    metrics.save()
+    
+    # Commit each file
+    if is_update:
+        template = target["config"].get(
+            "update_message_template",
+            "Update: {problem_id} - {problem_title} [{difficulty}] ({runtime}, {memory})"
+        )
+    else:
+        template = target["config"].get(
+            "commit_message_template",
+            "Add: {problem_id} - {problem_title} [{difficulty}]"
+        )
+    
+    commit_msg = template.format(
+        problem_id=problem_id,
+        problem_title=title,
+        difficulty=difficulty,
+        runtime=runtime,
+        memory=memory
+    )
+    
+    paths = [file_path, metrics.path] + (removed_paths or [])
+    target["git_handler"].commit_all(commit_msg, paths=paths)
+
+
+def sync_submission(
+    submission: dict,
+    api: "LeetCodeAPI",
+    catalog: "ProblemCatalog",
+    targets: List[dict],
+    dry_run: bool = False,
+    force: bool = False,
+    details: Optional[dict] = None,
+    best_runtime: bool = False
+) -> str:
+    """
+    Fetch a single submission once, then save and commit it to every target
+    that does not have it yet
+    
+    If details were already fetched (with the question), they are reused.
+    With best_runtime, targets that have the problem are also updated when
+    the submission is strictly faster than their stored numbers.
+    
+    Returns "new", "skipped" or "failed"
+    """
+    title_slug = submission.get("titleSlug")
+    title = submission.get("title")
+    runtime = submission.get("runtime", "")
+    memory = submission.get("memory", "")
+    
+    def needs_write(target: dict, problem_id: str) -> bool:
+        if force or problem_id.zfill(4) not in target["existing"]:
+            return True
+        if not best_runtime:
+            return False
+        
+        stored = target["metrics"].get(problem_id)
+        if stored is None:
+            return False
+        if stored.get("runtime_ms") is None:
+            # No numbers to beat: keep the file, remember these as its baseline
+            target["metrics"].set_baseline(problem_id, runtime, memory)
+            return False
+        if stored.get("submission_id") == str(submission.get("id")):
+            return False
+        
+        is_better = lazy_import("solution_metrics").is_better
+        return is_better(runtime, memory, stored)
+    
+    def pending_targets(problem_id: str) -> List[dict]:
+        return [t for t in targets if needs_write(t, problem_id)]
+    
+    # Known problems are resolved from the catalog, so the existence
+    # check happens before any per-submission request
+    problem = catalog.get(title_slug)
+    if problem and not pending_targets(problem["questionId"]):
+        print(f"  → Skipping (already exists)")
+        return "skipped"
+    
+    # Get detailed submission info
+    if details is None:
+        details = api.get_submission_code(
+            submission["id"],
+            include_question=problem is None
+        )
+    
+    if not details:
+        print(f"  ✗ Could not fetch submission details")
+        return "failed"
+    
+    # Problems missing from the snapshot (e.g. newly released) are
+    # resolved from the submission itself and added to the catalog
+    if problem is None:
+        catalog.add(details.get("question") or {})
+        problem = catalog.get(title_slug) or {}
+    
+    problem_id = problem.get("questionId", "0")
+    
+    # Skip if already exists (unless force)
+    pending = pending_targets(problem_id)
+    if not pending:
+        print(f"  → Skipping (already exists)")
+        return "skipped"
+    
+    # Get language and extension
+    lang_info = details.get("lang", {})
+    language = lang_info.get("name", submission.get("lang", "unknown"))
+    extension = api.get_extension(language)
+    
+    if dry_run:
+        for target in pending:
+            label = f" to {target['name']}" if target["name"] else ""
+            action = "update" if problem_id.zfill(4) in target["existing"] else "save"
+            print(f"  [DRY RUN] Would {action}{label}: {problem_id.zfill(4)}-{title_slug}{extension}")
+        return "new"
+    
+    solution = {
+        "submission_id": submission.get("id"),
+        "timestamp": submission.get("timestamp"),
+        "code": details.get("code", ""),
+        "problem_id": problem_id,
+        "title": title,
+        "title_slug": title_slug,
+        "difficulty": problem.get("difficulty", "Unknown"),
+        "extension": extension,
+        "language": language,
+        "topics": problem.get("topics", []),
+        "runtime": runtime,
+        "memory": memory,
+    }
+    
+    def save(target: dict) -> Optional[str]:
+        return save_to_target(target, solution, force, best_runtime)
+    
+    # Targets are separate repos, so they can be written in parallel
+    if len(pending) == 1:
+        paths = [save(pending[0])]
+    else:
+        from contextlib import redirect_stdout
+        from concurrent.futures import ThreadPoolExecutor
+        with redirect_stdout(LineOutput(sys.stdout)):
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                paths = list(executor.map(save, pending))
+    
+    if not any(paths):
+        print(f"  → Skipping (already exists)")
+        return "skipped"
+    
+    return "new"
+
+
+def select_best_submissions(submissions: List[dict]) -> List[dict]:
+    """Keep the fastest accepted submission per problem, in listing order"""
+    solution_metrics = lazy_import("solution_metrics")
+    
+    best = {}
+    for submission in submissions:
+        title_slug = submission.get("titleSlug")
+        current = best.get(title_slug)
+        if current is None:
+            best[title_slug] = submission
+            continue
+        
+        stored = {
+            "runtime_ms": solution_metrics.parse_runtime(current.get("runtime")),
+            "memory_mb": solution_metrics.parse_memory(current.get("memory")),
+        }
+        if solution_metrics.is_better(submission.get("runtime"), submission.get("memory"), stored):
+            best[title_slug] = submission
+    
+    return list(best.values())
+
+
+def schedule_work(
+    submissions: List[dict],
+    catalog: "ProblemCatalog",
+    targets: List[dict],
+    order: str = "newest"
+) -> List[dict]:
+    """
+    Order submissions for a time-budgeted run
+    
+    "newest" syncs the most recent submissions first. "new-first" puts
+    problems that no target has yet (or that the catalog doesn't know)
+    ahead of updates to existing ones, newest first within each group.
+    """
+    # Newest submission per problem (pending work may repeat the listing)
+    latest = {}
+    for submission in submissions:
+        title_slug = submission.get("titleSlug")
+        current = latest.get(title_slug)
+        if current is None or int(submission.get("timestamp", 0)) > int(current.get("timestamp", 0)):
+            latest[title_slug] = submission
+    
+    def is_new(submission: dict) -> bool:
+        problem = catalog.get(submission.get("titleSlug"))
+        if not problem:
+            return True
+        problem_id = problem["questionId"].zfill(4)
+        return any(problem_id not in target["existing"] for target in targets)
+    
+    def newest(submission: dict) -> int:
+        return -int(submission.get("timestamp", 0))
+    
+    if order == "new-first":
+        return sorted(latest.values(), key=lambda sub: (not is_new(sub), newest(sub)))
+    return sorted(latest.values(), key=newest)
+
+
+def push_targets(targets: List[dict], dry_run: bool = False) -> None:
+    """Push every target that received new solutions"""
+    for target in targets:
+        if not dry_run and target["new"] > 0 and target["config"].get("auto_push", True):
+            label = f" ({target['name']})" if target["name"] else ""
+            print(f"Pushing to GitHub{label}...")
+            target["git_handler"].push()
+        target["new"] = 0
+
+
+def sync_submissions(
+    config: dict,
+    max_submissions: int = 100,
+    dry_run: bool = False,
+    force: bool = False,
+    today_only: bool = False,
+    refresh_catalog: bool = False,
+    filters: Optional[dict] = None,
+    since: Optional[int] = None,
+    deadline: Optional[float] = None,
+    order: str = "newest"
+):
+    """
+    Main sync function
+    
+    Args:
+        config: Configuration dictionary
+        max_submissions: Maximum number of submissions to sync
+        dry_run: If True, don't actually save files or commit
+        force: If True, overwrite existing files
+        refresh_catalog: If True, re-fetch the problem catalog snapshot
+        filters: Submission filters from build_filters
+        since: Sync every submission at or after this unix timestamp
+        deadline: Time budget in seconds for the whole run. Work is
+            scheduled by `order`, pushed incrementally, and whatever is
+            left when the budget runs out is recorded for the next run.
+        order: "newest" or "new-first" (never-synced problems before updates)
+    """
+    if not validate_config(config):
+        return
+    
+    # Initialize components
+    api = create_api(config)
+    
+    targets = build_targets(config)
+    
+    # Verify authentication
+    if not authenticate(api):
+        return
+    
+    prepare_targets(targets, dry_run=dry_run)
+    catalog = load_catalog(config, api, refresh=refresh_catalog)
     
     # Fetch submissions
-    submissions = api.get_all_accepted_submissions(max_submissions, today_only=today_only)
+    submissions = api.get_all_accepted_submissions(
+        max_submissions,
+        today_only=today_only,
+        filters=filters,
+        since=since
+    )
+    
+    SyncState = lazy_import("sync_state").SyncState
+    state = SyncState(config.get("state_path", ".sync_state.json"))
+    state.load()
+    listed = submissions
+    
+    # A filtered run only covers part of the history, so it leaves the
+    # pending work and the watermark to the next full run
+    filtered = bool(filters)
+    
+    # The watermark may only move past what this run listed: everything
+    # newer than the previous watermark
+    covers_gap = (
+        not state.watermark
+        or (since is not None and since <= state.watermark)
+        or any(int(sub.get("timestamp") or 0) <= state.watermark for sub in listed)
+    )
+    
+    if not filtered and state.pending:
+        print(f"Resuming {len(state.pending)} submissions left by the previous run")
+        submissions = submissions + state.pending
+    
+    # Keep the fastest submission per problem instead of the newest
+    best_runtime = config.get("retention", "first") == "best_runtime"
+    if best_runtime:
+        submissions = select_best_submissions(submissions)
+    
+    if deadline is not None:
+        submissions = schedule_work(submissions, catalog, targets, order)
     
     if not submissions:
         print("No accepted submissions found.")
@@ -109,100 +718,537 @@ def sync_submissions(
     synced_problems = set()
     new_solutions = 0
     skipped = 0
+    remaining = []
+    failed = []
+    
+    # Time budget bookkeeping (only used with a deadline)
+    stop_at = STARTED_AT + deadline if deadline is not None else None
+    reserve = config.get("deadline_reserve_seconds", 30)
+    push_every = config.get("push_every", 10)
+    item_seconds = []
+    unpushed = 0
+    
+    if stop_at is not None and time.perf_counter() + 2.0 + reserve > stop_at:
+        print(f"Warning: --deadline {deadline:g}s leaves no time beyond the {reserve}s "
+              "reserved for the final push (deadline_reserve_seconds), nothing will be synced")
     
     for i, submission in enumerate(submissions, 1):
         title_slug = submission.get("titleSlug")
-        title = submission.get("title")
         
         # Skip if already processed this problem
         if title_slug in synced_problems:
             continue
         
+        # Stop while there is still time to commit, push and record state
+        if stop_at is not None:
+            estimate = max(item_seconds[-20:]) if item_seconds else 2.0
+            if time.perf_counter() + estimate + reserve > stop_at:
+                remaining = [
+                    sub for sub in submissions[i - 1:]
+                    if sub.get("titleSlug") not in synced_problems
+                ]
+                print(f"\n⏱ Time budget nearly used, stopping with {len(remaining)} submissions left")
+                break
+        
         synced_problems.add(title_slug)
         
-        print(f"[{i}/{len(submissions)}] Processing: {title}")
+        print(f"[{i}/{len(submissions)}] Processing: {submission.get('title')}")
         
-        # Get detailed submission info
-        details = api.get_submission_code(submission["id"])
+        item_start = time.perf_counter()
+        result = sync_submission(
+            submission, api, catalog, targets,
+            dry_run=dry_run, force=force, best_runtime=best_runtime
+        )
         
-        if not details:
-            print(f"  ✗ Could not fetch submission details")
+        if result == "skipped":
+            skipped += 1
+            continue
+        if result == "failed":
+            failed.append(submission)
             continue
         
-        # Get problem info
-        question = details.get("question", {})
-        problem_id = question.get("questionId", "0")
-        difficulty = question.get("difficulty", "Unknown")
-        topics = [tag["name"] for tag in question.get("topicTags", [])]
+        new_solutions += 1
         
-        # Skip if already exists (unless force)
-        if problem_id.zfill(4) in existing and not force:
-            print(f"  → Skipping (already exists)")
-            skipped += 1
-            continue
+        # Rate limiting
+        if not dry_run:
+            time.sleep(0.3)
+        item_seconds.append(time.perf_counter() - item_start)
+        
+        # Push as we go so progress survives the job being killed
+        unpushed += 1
+        if stop_at is not None and unpushed >= push_every:
+            push_targets(targets, dry_run=dry_run)
+            unpushed = 0
+    
+    if catalog.dirty:
+        catalog.save()
+    
+    if not dry_run:
+        # Baselines picked up for solutions that had no numbers
+        for target in targets:
+            commit_metrics(target, "Record metrics for existing solutions")
+    
+    if not dry_run:
+        # Failed submissions are retried next run along with unstarted work
+        if filtered:
+            # The previous pending work wasn't resumed, keep it
+            state.add_pending(failed + remaining)
+        else:
+            state.set_pending(failed + remaining)
+            
+            # Everything listed is now synced or recorded as pending
+            if covers_gap:
+                state.advance(listed)
+        state.save()
+    
+    # Summary
+    print()
+    print("=" * 50)
+    print("Sync Complete!")
+    print("=" * 50)
+    print(f"  New solutions: {new_solutions}")
+    print(f"  Skipped (existing): {skipped}")
+    if remaining:
+        print(f"  Left for next run: {len(remaining)}")
+    print()
+    
+    # Push to remote
+    push_targets(targets, dry_run=dry_run)
+
+
+def reconcile(
+    config: dict,
+    fetch: bool = False,
+    dry_run: bool = False,
+    force: bool = False,
+    refresh_catalog: bool = False,
+    filters: Optional[dict] = None
+):
+    """
+    Compare LeetCode's accepted-submission history against the repo
+    
+    Args:
+        config: Configuration dictionary
+        fetch: If True, sync the missing problems
+        dry_run: If True, don't actually save files or commit
+        force: If True, also re-sync stale problems (newer submission than
+            the one recorded for the file)
+        refresh_catalog: If True, re-fetch the problem catalog snapshot
+        filters: Submission filters from build_filters
+    """
+    if not validate_config(config):
+        return
+    
+    api = create_api(config)
+    
+    targets = build_targets(config)
+    
+    if not authenticate(api, "LeetCode Reconcile"):
+        return
+    
+    catalog = load_catalog(config, api, refresh=refresh_catalog)
+    
+    # Newest accepted submission per problem (the listing is newest first)
+    print("Streaming accepted submissions...")
+    latest = {}
+    listing = api.iter_accepted_submissions(config.get("list_page_size", 100), **(filters or {}))
+    for submission in listing:
+        latest.setdefault(submission.get("titleSlug"), submission)
+    print(f"  {len(latest)} distinct accepted problems on LeetCode")
+    
+    remote = {}
+    unresolved = set()
+    for title_slug in latest:
+        problem = catalog.get(title_slug)
+        if problem:
+            remote[problem["questionId"].zfill(4)] = title_slug
+        else:
+            unresolved.add(title_slug)
+    
+    missing = set(unresolved)
+    stale = set()
+    
+    for target in targets:
+        # Local index: problem id -> solution file
+        index = target["file_manager"].get_solution_index()
+        target["index"] = index
+        target["existing"] = set(index)
+        target["metrics"].load()
         
-        # Get language and extension
-        lang_info = details.get("lang", {})
-        language = lang_info.get("name", submission.get("lang", "unknown"))
-        extension = api.get_extension(language)
+        # When a file was synced is taken from its recorded submission, or
+        # for files synced before those were recorded, from its last commit
+        # (recorded once; only a fetching run commits the result)
+        seed_metrics(target, dry_run=dry_run or not fetch)
         
-        code = details.get("code", "")
+        missing_ids = remote.keys() - index.keys()
+        local_only = index.keys() - remote.keys()
         
-        if dry_run:
-            print(f"  [DRY RUN] Would save: {problem_id.zfill(4)}-{title_slug}{extension}")
-            new_solutions += 1
-            continue
+        stale_ids = set()
+        undated = 0
+        for problem_id in remote.keys() & index.keys():
+            synced_at = target["metrics"].get(problem_id).get("timestamp")
+            if not synced_at:
+                undated += 1
+            elif int(latest[remote[problem_id]].get("timestamp", 0)) > synced_at:
+                stale_ids.add(problem_id)
         
-        # Save solution
-        file_path = file_manager.save_solution(
-            code=code,
-            problem_id=problem_id,
-            title=title,
-            title_slug=title_slug,
-            difficulty=difficulty,
-            extension=extension,
-            language=language,
-            topics=topics,
-            runtime=submission.get("runtime", ""),
-            memory=submission.get("memory", ""),
-            include_header=config.get("include_problem_description", True)
-        )
+        target_missing = sorted(remote[problem_id] for problem_id in missing_ids) + sorted(unresolved)
+        target_stale = sorted(remote[problem_id] for problem_id in stale_ids)
+        missing.update(target_missing)
+        stale.update(target_stale)
+        
+        print()
+        print("=" * 50)
+        print(f"Reconcile Report {target['name']}".rstrip())
+        print("=" * 50)
+        print(f"  {len(index)} solutions in repository")
+        print(f"  Missing: {len(target_missing)}")
+        for title_slug in target_missing:
+            print(f"    - {title_slug}")
+        print(f"  Stale (newer submission than the synced one): {len(target_stale)}")
+        for title_slug in target_stale:
+            print(f"    - {title_slug}")
+        print(f"  Only in repository: {len(local_only)}")
+        if undated:
+            print(f"  Unknown sync time (not checked for staleness): {undated}")
+    print()
+    
+    if not fetch:
+        return
+    
+    if not dry_run:
+        for target in targets:
+            if not target["git_handler"].is_git_repo():
+                target["git_handler"].init_repo()
+    
+    to_sync = sorted(missing) + (sorted(stale - missing) if force else [])
+    new_solutions = 0
+    
+    for i, title_slug in enumerate(to_sync, 1):
+        submission = latest[title_slug]
+        print(f"[{i}/{len(to_sync)}] Processing: {submission.get('title')}")
         
-        if file_path:
-            print(f"  ✓ Saved: {os.path.basename(file_path)}")
+        result = sync_submission(
+            submission, api, catalog, targets,
+            dry_run=dry_run, force=title_slug in stale
+        )
+        if result == "new":
             new_solutions += 1
+            if not dry_run:
+                time.sleep(0.3)
+    
+    if catalog.dirty:
+        catalog.save()
+    
+    print()
+    print(f"Synced {new_solutions} of {len(to_sync)} problems")
+    
+    push_targets(targets, dry_run=dry_run)
+
+
+def backfill(
+    config: dict,
+    workers: int = 4,
+    dry_run: bool = False,
+    refresh_catalog: bool = False,
+    since: Optional[int] = None
+):
+    """
+    Import submission history with several worker processes
+    
+    The coordinator streams the (cheap) listing and keeps the newest
+    submission per problem; only the detail fetches for problems still
+    missing are split across workers. Each worker has its own API session
+    and share of the request rate, and renders solution files into a
+    staging area. The coordinator then commits the results in listing
+    order, so the result matches a serial run.
+    
+    Args:
+        config: Configuration dictionary
+        workers: Number of worker processes
+        dry_run: If True, don't move files into the repos or commit
+        refresh_catalog: If True, re-fetch the problem catalog snapshot
+        since: Only backfill submissions at or after this unix timestamp
+    """
+    import shutil
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+    
+    if not validate_config(config):
+        return
+    
+    backfill_workers = lazy_import("backfill")
+    api = create_api(config)
+    targets = build_targets(config)
+    
+    if not authenticate(api, "LeetCode Backfill"):
+        return
+    
+    prepare_targets(targets, dry_run=dry_run)
+    catalog = load_catalog(config, api, refresh=refresh_catalog)
+    if catalog.dirty:
+        catalog.save()
+    
+    # Newest submission per problem (the listing is newest first)
+    print("Listing submission history...")
+    latest = {}
+    total = 0
+    for submission in api.iter_accepted_submissions(config.get("list_page_size", 100), after=since):
+        latest.setdefault(submission.get("titleSlug"), (total, submission))
+        total += 1
+    
+    def is_missing(title_slug: str) -> bool:
+        problem = catalog.get(title_slug)
+        if not problem:
+            return True
+        problem_id = problem["questionId"].zfill(4)
+        return any(problem_id not in target["existing"] for target in targets)
+    
+    work = [item for title_slug, item in latest.items() if is_missing(title_slug)]
+    shards = backfill_workers.plan_shards(len(work), workers)
+    print(f"  {total} accepted submissions, {len(latest)} problems, {len(work)} to fetch in {len(shards)} shards")
+    print()
+    
+    if not shards:
+        print("Nothing to backfill.")
+        return
+    
+    # Each worker gets an equal share of the serial request rate
+    delay = config.get("backfill_request_delay", 0.3) * len(shards)
+    staging_root = tempfile.mkdtemp(prefix="leetcode-backfill-")
+    
+    jobs = [
+        {
+            "config": config,
+            "submissions": work[start:end],
+            "delay": delay,
+            "catalog_path": catalog.cache_path,
+            "staging_dir": os.path.join(staging_root, f"shard-{n}"),
+            "targets": [target["config"] for target in targets],
+            "existing": [sorted(target["existing"]) for target in targets],
+        }
+        for n, (start, end) in enumerate(shards)
+    ]
+    
+    new_solutions = 0
+    
+    try:
+        print(f"Fetching with {len(shards)} workers...")
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            results = list(executor.map(backfill_workers.fetch_shard, jobs))
+        
+        entries = backfill_workers.merge_entries(results)
+        print(f"\nCommitting {len(entries)} problems")
+        print("-" * 50)
+        
+        for i, entry in enumerate(entries, 1):
+            if entry["question"]:
+                catalog.add(entry["question"])
             
-            # Commit each file
-            commit_msg = config.get(
-                "commit_message_template",
-                "Add: {problem_id} - {problem_title} [{difficulty}]"
-            ).format(
-                problem_id=problem_id,
-                problem_title=title,
-                difficulty=difficulty
-            )
+            print(f"[{i}/{len(entries)}] {entry['title']}")
+            saved = False
             
-            git_handler.commit_file(file_path, commit_msg)
-        else:
-            print(f"  → Skipping (already exists)")
-            skipped += 1
-        
-        # Rate limiting
-        time.sleep(0.3)
+            for target_index, rel_path in sorted(entry["files"].items()):
+                target = targets[target_index]
+                dest = os.path.join(target["file_manager"].base_path, rel_path)
+                
+                if entry["problem_id"].zfill(4) in target["existing"] or os.path.exists(dest):
+                    continue
+                
+                saved = True
+                if dry_run:
+                    label = f" to {target['name']}" if target["name"] else ""
+                    print(f"  [DRY RUN] Would save{label}: {rel_path}")
+                    continue
+                
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                shutil.move(os.path.join(entry["staging"][target_index], rel_path), dest)
+                submission = entry["submission"]
+                commit_solution(
+                    target, dest, entry["problem_id"], entry["title"], entry["difficulty"],
+                    submission_id=submission.get("id"),
+                    timestamp=submission.get("timestamp"),
+                    runtime=submission.get("runtime", ""),
+                    memory=submission.get("memory", "")
+                )
+            
+            if saved:
+                new_solutions += 1
+            else:
+                print(f"  → Skipping (already exists)")
+    finally:
+        shutil.rmtree(staging_root, ignore_errors=True)
+    
+    if catalog.dirty:
+        catalog.save()
     
-    # Summary
     print()
     print("=" * 50)
-    print("Sync Complete!")
+    print("Backfill Complete!")
     print("=" * 50)
     print(f"  New solutions: {new_solutions}")
-    print(f"  Skipped (existing): {skipped}")
     print()
     
-    # Push to remote
-    if not dry_run and new_solutions > 0 and config.get("auto_push", True):
-        print("Pushing to GitHub...")
-        git_handler.push()
+    push_targets(targets, dry_run=dry_run)
+
+
+def serve(config: dict, host: str = "127.0.0.1", port: int = 8765):
+    """
+    Run a local webhook listener that syncs single submissions on demand
+    
+    A POST with a submission id runs just that submission through
+    fetch → save → commit on a warm API session; pushes are coalesced so a
+    burst of submissions results in one push.
+    """
+    from webhook_server import SyncServer
+    
+    if not validate_config(config):
+        return
+    
+    api = create_api(config)
+    targets = build_targets(config)
+    
+    if not authenticate(api, "LeetCode Sync Server"):
+        return
+    
+    prepare_targets(targets)
+    catalog = load_catalog(config, api)
+    
+    def handle_submission(submission_id: str) -> str:
+        details = api.get_submission_code(submission_id)
+        if not details:
+            print(f"  ✗ Could not fetch submission {submission_id}")
+            return "failed"
+        
+        if details.get("statusDisplay") != "Accepted":
+            print(f"  → Skipping {submission_id} ({details.get('statusDisplay')})")
+            return "skipped"
+        
+        question = details.get("question") or {}
+        submission = {
+            "id": submission_id,
+            "title": question.get("title"),
+            "titleSlug": question.get("titleSlug"),
+            "lang": (details.get("lang") or {}).get("name", "unknown"),
+            "runtime": details.get("runtimeDisplay", ""),
+            "memory": details.get("memoryDisplay", ""),
+            "timestamp": details.get("timestamp"),
+        }
+        
+        print(f"Processing: {submission['title']}")
+        result = sync_submission(
+            submission, api, catalog, targets,
+            details=details,
+            best_runtime=config.get("retention", "first") == "best_runtime"
+        )
+        
+        if catalog.dirty:
+            catalog.save()
+        return result
+    
+    def flush():
+        push_targets(targets)
+    
+    server = SyncServer(
+        handle_submission,
+        flush,
+        host=host,
+        port=port,
+        token=config.get("webhook_token", ""),
+        coalesce_seconds=config.get("webhook_coalesce_seconds", 5)
+    )
+    server.serve_forever()
+
+
+# Local state files bundled into a state snapshot: section -> (config key, default path)
+SNAPSHOT_FILES = {
+    "catalog": ("catalog_path", ".leetcode_catalog.json"),
+    "sync_state": ("state_path", ".sync_state.json"),
+}
+
+
+def export_state(config: dict, path: str) -> bool:
+    """
+    Bundle the problem catalog, sync state (watermark and pending work)
+    and each target's solution index into one snapshot file
+    """
+    StateSnapshot = lazy_import("state_snapshot").StateSnapshot
+    snapshot = StateSnapshot(path)
+    
+    for name, (key, default) in SNAPSHOT_FILES.items():
+        try:
+            with open(config.get(key, default), "r", encoding="utf-8") as f:
+                snapshot.add(name, json.load(f))
+        except FileNotFoundError:
+            continue
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: not exporting unreadable {name}: {e}")
+    
+    index = {}
+    for target in build_targets(config):
+        base_path = target["file_manager"].base_path
+        index[target["name"] or "default"] = {
+            problem_id: os.path.relpath(file_path, base_path).replace(os.sep, "/")
+            for problem_id, file_path in target["file_manager"].get_solution_index().items()
+        }
+    snapshot.add("solution_index", index)
+    
+    if not snapshot.save():
+        return False
+    
+    print(f"✓ Exported state ({', '.join(snapshot.sections)}) to {path}")
+    return True
+
+
+def import_state(config: dict, path: str) -> bool:
+    """
+    Restore local state files from a snapshot
+    
+    Damaged sections are skipped, and local files newer than the snapshot
+    are kept. Returns False if the snapshot is missing or unreadable.
+    """
+    StateSnapshot = lazy_import("state_snapshot").StateSnapshot
+    snapshot = StateSnapshot(path)
+    
+    if not snapshot.load():
+        print(f"No usable state snapshot at {path}, starting cold")
+        return False
+    
+    for name in snapshot.skipped:
+        print(f"Warning: state snapshot section '{name}' is corrupt, skipping it")
+    
+    restored = []
+    for name, (key, default) in SNAPSHOT_FILES.items():
+        if name not in snapshot.sections:
+            continue
+        
+        local_path = config.get(key, default)
+        if os.path.exists(local_path) and os.path.getmtime(local_path) >= snapshot.created_at:
+            continue
+        
+        try:
+            tmp_path = local_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot.sections[name], f, separators=(",", ":"))
+            os.replace(tmp_path, local_path)
+            restored.append(name)
+        except OSError as e:
+            print(f"Warning: could not restore {name}: {e}")
+    
+    # The index is not restored (the repo is the source of truth), only
+    # compared, so a snapshot from a different checkout is noticed
+    index = snapshot.sections.get("solution_index", {})
+    for target in build_targets(config):
+        expected = index.get(target["name"] or "default")
+        if expected is None:
+            continue
+        missing = set(expected) - set(target["file_manager"].get_solution_index())
+        if missing:
+            label = f" ({target['name']})" if target["name"] else ""
+            print(f"Warning: {len(missing)} solutions in the state snapshot are not in the repo{label}")
+    
+    print(f"✓ Imported state ({', '.join(restored) or 'nothing newer'}) from {path}")
+    return True
 
 
 def main():
@@ -210,6 +1256,15 @@ def main():
         description="Sync LeetCode submissions to GitHub"
     )
     
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["sync", "reconcile", "backfill"],
+        default="sync",
+        help="sync (default), reconcile the repo against LeetCode history, "
+             "or backfill the full history with several workers"
+    )
+    
     parser.add_argument(
         "--config", "-c",
         default="config.json",
@@ -235,18 +1290,126 @@ def main():
         help="Overwrite existing solutions"
     )
     
+    parser.add_argument(
+        "--best-runtime",
+        action="store_true",
+        help="Keep each problem's fastest accepted solution, updating existing files"
+    )
+    
     parser.add_argument(
         "--today",
         action="store_true",
         help="Sync only today's submissions"
     )
     
+    since_group = parser.add_mutually_exclusive_group()
+    
+    since_group.add_argument(
+        "--since",
+        metavar="YYYY-MM-DD|last",
+        help="Sync every submission since this date (UTC) or the last synced one, ignoring --max"
+    )
+    
+    since_group.add_argument(
+        "--days",
+        type=int,
+        metavar="N",
+        help="Sync every submission from the last N days, ignoring --max"
+    )
+    
+    parser.add_argument(
+        "--lang",
+        action="append",
+        metavar="LANG",
+        help="Only sync submissions in this language (repeatable)"
+    )
+    
+    parser.add_argument(
+        "--slug",
+        action="append",
+        metavar="SLUG",
+        help="Only sync this problem, e.g. two-sum (repeatable)"
+    )
+    
+    parser.add_argument(
+        "--after",
+        metavar="YYYY-MM-DD",
+        help="Only sync submissions on or after this date (UTC)"
+    )
+    
+    parser.add_argument(
+        "--before",
+        metavar="YYYY-MM-DD",
+        help="Only sync submissions on or before this date (UTC)"
+    )
+    
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Stop cleanly within this time budget, pushing as it goes"
+    )
+    
+    parser.add_argument(
+        "--order",
+        choices=["newest", "new-first"],
+        help="Work order for --deadline runs (default: newest)"
+    )
+    
+    parser.add_argument(
+        "--refresh-catalog",
+        action="store_true",
+        help="Re-fetch the problem catalog snapshot before syncing"
+    )
+    
+    parser.add_argument(
+        "--fetch",
+        action="store_true",
+        help="With reconcile, fetch missing problems (and stale ones with --force)"
+    )
+    
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        help="Worker processes for backfill (default: backfill_workers or 4)"
+    )
+    
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run a local webhook listener for push-triggered syncs"
+    )
+    
+    parser.add_argument(
+        "--port",
+        type=int,
+        help="Port for --serve (default: webhook_port or 8765)"
+    )
+    
     parser.add_argument(
         "--test", "-t",
         action="store_true",
         help="Test LeetCode API connection only"
     )
     
+    parser.add_argument(
+        "--import-state",
+        metavar="FILE",
+        help="Restore caches and sync state from a snapshot before running"
+    )
+    
+    parser.add_argument(
+        "--export-state",
+        metavar="FILE",
+        help="Write caches and sync state to a snapshot after running"
+    )
+    
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report import and total run time"
+    )
+    
     args = parser.parse_args()
     
     # Change to script directory
@@ -254,19 +1417,60 @@ def main():
     os.chdir(script_dir)
     
     config = load_config(args.config)
+    filters = build_filters(args, config)
+    if args.best_runtime:
+        config["retention"] = "best_runtime"
+    
+    import_path = args.import_state or config.get("state_snapshot")
+    if import_path and not args.test:
+        import_state(config, import_path)
     
     if args.test:
         # Just test the connection
-        from leetcode_api import test_connection
-        test_connection()
+        lazy_import("leetcode_api").test_connection(config)
+    elif args.serve:
+        serve(
+            config,
+            host=config.get("webhook_host", "127.0.0.1"),
+            port=args.port or config.get("webhook_port", 8765)
+        )
+    elif args.command == "backfill":
+        backfill(
+            config,
+            workers=args.workers or config.get("backfill_workers", 4),
+            dry_run=args.dry_run,
+            refresh_catalog=args.refresh_catalog,
+            since=resolve_since(args, config)
+        )
+    elif args.command == "reconcile":
+        reconcile(
+            config,
+            fetch=args.fetch,
+            dry_run=args.dry_run,
+            force=args.force,
+            refresh_catalog=args.refresh_catalog,
+            filters=filters
+        )
     else:
         sync_submissions(
             config,
             max_submissions=args.max,
             dry_run=args.dry_run,
             force=args.force,
-            today_only=args.today or config.get("today_only", False)
+            today_only=args.today or config.get("today_only", False),
+            refresh_catalog=args.refresh_catalog,
+            filters=filters,
+            since=resolve_since(args, config),
+            deadline=args.deadline or config.get("deadline_seconds"),
+            order=args.order or config.get("schedule_order", "newest")
         )
+    
+    export_path = args.export_state or config.get("state_snapshot")
+    if export_path and not args.test and not args.dry_run:
+        export_state(config, export_path)
+    
+    if args.timings:
+        report_timings()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+"""
+Problem Catalog
+Local snapshot of LeetCode problem metadata (id, difficulty, topics)
+"""
+
+import os
+import json
+import time
+from typing import Dict, Optional
+
+
+class ProblemCatalog:
+    """Caches problem set metadata so submissions only need to fetch code"""
+    
+    VERSION = 1
+    
+    def __init__(self, cache_path: str = ".leetcode_catalog.json", refresh_hours: float = 168):
+        """
+        Initialize problem catalog
+        
+        Args:
+            cache_path: JSON file the snapshot is stored in
+            refresh_hours: Age after which the snapshot is re-fetched
+        """
+        self.cache_path = os.path.abspath(cache_path)
+        self.refresh_hours = refresh_hours
+        self.fetched_at = 0.0
+        self.problems: Dict[str, Dict] = {}
+        self.dirty = False
+    
+    def load(self) -> bool:
+        """Load the snapshot from disk, returns True if one was found"""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: ignoring unreadable catalog {self.cache_path}: {e}")
+            return False
+        
+        if data.get("version") != self.VERSION:
+            return False
+        
+        self.fetched_at = data.get("fetched_at", 0.0)
+        self.problems = data.get("problems", {})
+        return True
+    
+    def save(self) -> bool:
+        """Write the snapshot to disk"""
+        data = {
+            "version": self.VERSION,
+            "fetched_at": self.fetched_at,
+            "problems": self.problems,
+        }
+        
+        try:
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+            self.dirty = False
+            return True
+        except OSError as e:
+            print(f"Error saving catalog: {e}")
+            return False
+    
+    def is_stale(self) -> bool:
+        """Check if the snapshot is missing or older than the refresh interval"""
+        if not self.problems:
+            return True
+        return time.time() - self.fetched_at > self.refresh_hours * 3600
+    
+    def refresh(self, api) -> bool:
+        """Replace the snapshot with a fresh copy of the whole problem set"""
+        print("Refreshing problem catalog...")
+        questions = api.get_problem_catalog()
+        
+        if not questions:
+            print("  ✗ Could not fetch problem catalog")
+            return False
+        
+        self.problems = {}
+        for question in questions:
+            self.add(question)
+        
+        self.fetched_at = time.time()
+        print(f"  Cached metadata for {len(self.problems)} problems")
+        return self.save()
+    
+    def ensure_fresh(self, api, force: bool = False) -> bool:
+        """Load the snapshot and refresh it if it is stale"""
+        self.load()
+        if force or self.is_stale():
+            return self.refresh(api)
+        return True
+    
+    def add(self, question: Dict) -> None:
+        """Add or update a problem from a GraphQL `question` object"""
+        title_slug = question.get("titleSlug")
+        if not title_slug:
+            return
+        
+        self.problems[title_slug] = {
+            "questionId": str(question.get("questionId", "0")),
+            "questionFrontendId": str(question.get("questionFrontendId", "")),
+            "title": question.get("title", ""),
+            "difficulty": question.get("difficulty", "Unknown"),
+            "topics": [tag["name"] for tag in question.get("topicTags") or []],
+        }
+        self.dirty = True
+    
+    def get(self, title_slug: str) -> Optional[Dict]:
+        """Get cached metadata for a problem"""
+        return self.problems.get(title_slug)
@@ -0,0 +1,167 @@
+"""
+Solution Metrics
+Which submission each kept solution came from, and its runtime/memory
+"""
+
+import os
+import re
+import json
+from typing import Dict, Optional
+
+
+# Unit multipliers to milliseconds and megabytes
+RUNTIME_UNITS = {"ms": 1.0, "s": 1000.0}
+MEMORY_UNITS = {"kb": 1 / 1024, "mb": 1.0, "gb": 1024.0}
+
+# Lines searched for Runtime/Memory in a solution's header comment
+HEADER_LINES = 20
+
+
+def parse_measure(value: str, units: Dict[str, float]) -> Optional[float]:
+    """Parse a value like "40 ms" or "14.2 MB", None if it can't be read"""
+    match = re.match(r'^\s*([\d.]+)\s*([a-zA-Z]*)\s*$', str(value or ""))
+    if not match:
+        return None
+    
+    unit = match.group(2).lower() or next(iter(units))
+    if unit not in units:
+        return None
+    
+    try:
+        return float(match.group(1)) * units[unit]
+    except ValueError:
+        return None
+
+
+def parse_runtime(value: str) -> Optional[float]:
+    """Parse a runtime string into milliseconds"""
+    return parse_measure(value, RUNTIME_UNITS)
+
+
+def parse_memory(value: str) -> Optional[float]:
+    """Parse a memory string into megabytes"""
+    return parse_measure(value, MEMORY_UNITS)
+
+
+def read_header_metrics(file_path: str) -> Dict[str, str]:
+    """Read the Runtime/Memory lines from a solution file's header comment"""
+    found = {}
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            for _, line in zip(range(HEADER_LINES), f):
+                match = re.match(r'^[\s*#/-]*(Runtime|Memory):\s*(.*\S)', line)
+                if match:
+                    found.setdefault(match.group(1).lower(), match.group(2))
+    except (OSError, UnicodeDecodeError):
+        pass
+    return found
+
+
+def is_better(runtime: str, memory: str, stored: Optional[Dict]) -> bool:
+    """
+    Check if a submission is strictly better than the stored numbers:
+    faster, or as fast with less memory
+    
+    Nothing stored means nothing to compare against, so it is not better.
+    """
+    runtime_ms = parse_runtime(runtime)
+    if runtime_ms is None or not stored:
+        return False
+    if stored.get("runtime_ms") is None:
+        return True
+    
+    if runtime_ms != stored["runtime_ms"]:
+        return runtime_ms < stored["runtime_ms"]
+    
+    memory_mb = parse_memory(memory)
+    return (
+        memory_mb is not None
+        and stored.get("memory_mb") is not None
+        and memory_mb < stored["memory_mb"]
+    )
+
+
+class SolutionMetrics:
+    """Per-repo store of the submission behind each kept solution"""
+    
+    FILENAME = ".solution_metrics.json"
+    
+    def __init__(self, repo_path: str):
+        """Initialize with the repository the metrics belong to"""
+        self.path = os.path.join(os.path.abspath(repo_path), self.FILENAME)
+        self.solutions: Dict[str, Dict] = {}
+        self.dirty = False
+    
+    def load(self) -> bool:
+        """Load stored metrics, returns True if a file was found"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.solutions = json.load(f).get("solutions", {})
+            return True
+        except FileNotFoundError:
+            return False
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            print(f"Warning: ignoring unreadable metrics {self.path}: {e}")
+            return False
+    
+    def save(self) -> bool:
+        """Write metrics to disk (sorted, so diffs stay small)"""
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"solutions": self.solutions}, f, indent=1, sort_keys=True)
+                f.write("\n")
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+            return True
+        except OSError as e:
+            print(f"Error saving metrics: {e}")
+            return False
+    
+    def get(self, problem_id: str) -> Optional[Dict]:
+        """Get stored metrics for a problem"""
+        return self.solutions.get(problem_id.zfill(4))
+    
+    def record(
+        self,
+        problem_id: str,
+        submission_id: str,
+        runtime: str,
+        memory: str,
+        file_path: str,
+        timestamp: Optional[int] = None
+    ) -> None:
+        """Store the submission now kept for a problem"""
+        self.solutions[problem_id.zfill(4)] = {
+            "submission_id": str(submission_id) if submission_id else None,
+            "timestamp": int(timestamp) if timestamp else None,
+            "runtime_ms": parse_runtime(runtime),
+            "memory_mb": parse_memory(memory),
+            "path": os.path.relpath(file_path, os.path.dirname(self.path)),
+        }
+        self.dirty = True
+    
+    def seed(self, problem_id: str, file_path: str) -> Dict:
+        """
+        Store numbers for a file synced before metrics were kept, read from
+        the Runtime/Memory lines of its header (None if it has none)
+        """
+        header = read_header_metrics(file_path)
+        self.record(problem_id, None, header.get("runtime", ""), header.get("memory", ""), file_path)
+        return self.solutions[problem_id.zfill(4)]
+    
+    def set_baseline(self, problem_id: str, runtime: str, memory: str) -> None:
+        """Fill in numbers for a kept solution that has none, without replacing it"""
+        runtime_ms = parse_runtime(runtime)
+        if runtime_ms is None:
+            return
+        entry = self.solutions[problem_id.zfill(4)]
+        entry["runtime_ms"] = runtime_ms
+        entry["memory_mb"] = parse_memory(memory)
+        self.dirty = True
+    
+    def set_timestamp(self, problem_id: str, timestamp: Optional[int]) -> None:
+        """Record when a kept solution was synced, if it is known"""
+        if timestamp:
+            self.solutions[problem_id.zfill(4)]["timestamp"] = int(timestamp)
+            self.dirty = True
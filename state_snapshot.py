@@ -0,0 +1,142 @@
+"""
+State Snapshot
+Packs local caches and sync state into one portable file for CI runners
+"""
+
+import os
+import json
+import time
+import zlib
+import hashlib
+from typing import Any, Dict, List, Optional
+
+
+class StateSnapshot:
+    """
+    Versioned bundle of named state sections
+    
+    The file starts with a header line, followed by one frame per section:
+    a line "SECTION <name> <length> <sha256>" and that many bytes of
+    zlib-compressed JSON. Each frame is compressed and checksummed on its
+    own, so damage to one section leaves the others readable.
+    """
+    
+    MAGIC = b"LEETCODE-SYNC-STATE"
+    VERSION = 2
+    FRAME = b"SECTION"
+    
+    def __init__(self, path: str = ".leetcode_state.snap"):
+        """
+        Initialize state snapshot
+        
+        Args:
+            path: File the snapshot is stored in
+        """
+        self.path = os.path.abspath(path)
+        self.created_at = 0.0
+        self.sections: Dict[str, Any] = {}
+        self.skipped: List[str] = []
+    
+    @staticmethod
+    def digest(name: bytes, blob: bytes) -> str:
+        """SHA-256 of a section's name and stored bytes"""
+        return hashlib.sha256(name + b"\0" + blob).hexdigest()
+    
+    def add(self, name: str, data: Any) -> None:
+        """Add or replace a section"""
+        self.sections[name] = data
+    
+    def save(self) -> bool:
+        """Write the snapshot to disk"""
+        self.created_at = time.time()
+        chunks = [b"%s %d %r\n" % (self.MAGIC, self.VERSION, self.created_at)]
+        
+        for name, section in self.sections.items():
+            raw = json.dumps(section, separators=(",", ":")).encode("utf-8")
+            blob = zlib.compress(raw)
+            encoded_name = name.encode("utf-8")
+            chunks.append(b"%s %s %d %s\n" % (
+                self.FRAME, encoded_name, len(blob), self.digest(encoded_name, blob).encode("ascii")
+            ))
+            chunks.append(blob + b"\n")
+        
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(b"".join(chunks))
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError as e:
+            print(f"Error saving state snapshot: {e}")
+            return False
+    
+    def _read_frame(self, data: bytes, start: int) -> Optional[int]:
+        """
+        Read the frame starting at `start` into `sections`
+        
+        Returns the offset after the frame, or None if the frame header is
+        damaged. A frame whose body fails its checksum is listed in `skipped`.
+        """
+        end = data.find(b"\n", start)
+        if end == -1:
+            return None
+        
+        fields = data[start:end].split(b" ")
+        if len(fields) != 4 or fields[0] != self.FRAME or not fields[2].isdigit():
+            return None
+        
+        name = fields[1].decode("utf-8", "replace")
+        length = int(fields[2])
+        blob = data[end + 1:end + 1 + length]
+        
+        try:
+            if self.digest(fields[1], blob) != fields[3].decode("ascii", "replace"):
+                raise ValueError("checksum mismatch")
+            self.sections[name] = json.loads(zlib.decompress(blob).decode("utf-8"))
+        except (ValueError, zlib.error):
+            self.skipped.append(name)
+            return None
+        
+        return end + 1 + length + 1
+    
+    def load(self) -> bool:
+        """
+        Load the snapshot from disk, returns True if it could be read
+        
+        Damaged sections are dropped (and listed in `skipped`); reading
+        resumes at the next frame, so the rest are still loaded.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            print(f"Warning: ignoring unreadable state snapshot {self.path}: {e}")
+            return False
+        
+        header, _, _ = data.partition(b"\n")
+        fields = header.split(b" ")
+        try:
+            if len(fields) != 3 or fields[0] != self.MAGIC or int(fields[1]) != self.VERSION:
+                raise ValueError
+            self.created_at = float(fields[2])
+        except ValueError:
+            print(f"Warning: ignoring state snapshot {self.path} (unsupported or damaged header)")
+            return False
+        
+        self.sections = {}
+        self.skipped = []
+        
+        position = len(header) + 1
+        while position < len(data):
+            next_position = self._read_frame(data, position)
+            if next_position is None:
+                # Resynchronize on the next frame header
+                found = data.find(b"\n" + self.FRAME + b" ", position)
+                if found == -1:
+                    break
+                next_position = found + 1
+            position = next_position
+        
+        return True
@@ -0,0 +1,90 @@
+"""
+Sync State
+Remembers how far syncing got and work left over when a run stops early
+"""
+
+import os
+import json
+import time
+from typing import Dict, List
+
+
+class SyncState:
+    """Persists the sync watermark and submissions a previous run did not get to"""
+    
+    VERSION = 1
+    
+    # Submission fields needed to resume work without re-listing
+    SUBMISSION_FIELDS = ("id", "title", "titleSlug", "lang", "runtime", "memory", "timestamp")
+    
+    def __init__(self, state_path: str = ".sync_state.json"):
+        """
+        Initialize sync state
+        
+        Args:
+            state_path: JSON file the state is stored in
+        """
+        self.state_path = os.path.abspath(state_path)
+        self.updated_at = 0.0
+        self.watermark = 0
+        self.pending: List[Dict] = []
+    
+    def load(self) -> bool:
+        """Load state from disk, returns True if any was found"""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: ignoring unreadable sync state {self.state_path}: {e}")
+            return False
+        
+        if data.get("version") != self.VERSION:
+            return False
+        
+        self.updated_at = data.get("updated_at", 0.0)
+        self.watermark = data.get("watermark", 0)
+        self.pending = data.get("pending", [])
+        return True
+    
+    def save(self) -> bool:
+        """Write state to disk"""
+        self.updated_at = time.time()
+        data = {
+            "version": self.VERSION,
+            "updated_at": self.updated_at,
+            "watermark": self.watermark,
+            "pending": self.pending,
+        }
+        
+        try:
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.state_path)
+            return True
+        except OSError as e:
+            print(f"Error saving sync state: {e}")
+            return False
+    
+    def set_pending(self, submissions: List[Dict]) -> None:
+        """Record submissions still to be synced"""
+        self.pending = [
+            {key: submission.get(key) for key in self.SUBMISSION_FIELDS}
+            for submission in submissions
+        ]
+    
+    def add_pending(self, submissions: List[Dict]) -> None:
+        """Record more submissions to be synced, keeping those already pending"""
+        known = {submission.get("id") for submission in self.pending}
+        self.pending += [
+            {key: submission.get(key) for key in self.SUBMISSION_FIELDS}
+            for submission in submissions
+            if submission.get("id") not in known
+        ]
+    
+    def advance(self, submissions: List[Dict]) -> None:
+        """Move the watermark up to the newest of the given submissions"""
+        for submission in submissions:
+            self.watermark = max(self.watermark, int(submission.get("timestamp") or 0))
@@ -0,0 +1,192 @@
+"""
+Webhook Server
+Local HTTP listener that syncs single submissions as soon as they are accepted
+"""
+
+import json
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional, Set
+
+
+class SyncServer:
+    """Queues submission ids from POST requests and syncs them one at a time"""
+    
+    ALLOWED_ORIGIN = "https://leetcode.com"
+    
+    def __init__(
+        self,
+        handle_submission: Callable[[str], str],
+        flush: Callable[[], None],
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        token: str = "",
+        coalesce_seconds: float = 5
+    ):
+        """
+        Initialize sync server
+        
+        Args:
+            handle_submission: Fetches, saves and commits one submission id
+            flush: Pushes everything committed since the last flush
+            host: Interface to listen on
+            port: Port to listen on
+            token: If set, requests must send it in the X-Sync-Token header
+            coalesce_seconds: Quiet period after the last commit before pushing
+        """
+        self.handle_submission = handle_submission
+        self.flush = flush
+        self.host = host
+        self.port = port
+        self.token = token
+        self.coalesce_seconds = coalesce_seconds
+        
+        self.queue: "queue.Queue[str]" = queue.Queue()
+        self.queued: Set[str] = set()
+        self.lock = threading.Lock()
+        self.git_lock = threading.Lock()
+        self.push_timer: Optional[threading.Timer] = None
+        self.push_pending = False
+    
+    def enqueue(self, submission_id: str) -> bool:
+        """Queue a submission id, returns False if it is already queued"""
+        with self.lock:
+            if submission_id in self.queued:
+                return False
+            self.queued.add(submission_id)
+        
+        self.queue.put(submission_id)
+        return True
+    
+    def _schedule_push(self) -> None:
+        """(Re)start the push timer so a burst of commits becomes one push"""
+        with self.lock:
+            if self.push_timer:
+                self.push_timer.cancel()
+            self.push_timer = threading.Timer(self.coalesce_seconds, self._push)
+            self.push_timer.daemon = True
+            self.push_timer.start()
+    
+    def _push(self) -> None:
+        """Push once the queue has drained, otherwise wait for the next commit"""
+        if not self.queue.empty():
+            return
+        
+        with self.git_lock:
+            self.push_pending = False
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error pushing: {e}")
+    
+    def _worker(self) -> None:
+        """Process queued submissions one at a time (git writes are serialized)"""
+        while True:
+            submission_id = self.queue.get()
+            
+            with self.lock:
+                self.queued.discard(submission_id)
+            
+            with self.git_lock:
+                try:
+                    result = self.handle_submission(submission_id)
+                except Exception as e:
+                    print(f"Error syncing submission {submission_id}: {e}")
+                    result = "failed"
+            
+            if result == "new":
+                self.push_pending = True
+            
+            # Restart the quiet period after each commit, and once the
+            # queue drains in case the last items were skipped
+            if result == "new" or (self.push_pending and self.queue.empty()):
+                self._schedule_push()
+            
+            self.queue.task_done()
+    
+    def _make_handler(self):
+        """Build the request handler class bound to this server"""
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: dict) -> None:
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("Access-Control-Allow-Origin", server.ALLOWED_ORIGIN)
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def do_OPTIONS(self):
+                # CORS preflight from a userscript/extension on leetcode.com
+                self.send_response(204)
+                self.send_header("Access-Control-Allow-Origin", server.ALLOWED_ORIGIN)
+                self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
+                self.send_header("Access-Control-Allow-Headers", "Content-Type, X-Sync-Token")
+                self.end_headers()
+            
+            def do_POST(self):
+                if self.path.rstrip("/") not in ("", "/sync"):
+                    self._send(404, {"error": "not found"})
+                    return
+                
+                # Pages on other sites can't send JSON without a preflight,
+                # and the preflight only allows leetcode.com
+                origin = self.headers.get("Origin")
+                if origin and origin != server.ALLOWED_ORIGIN:
+                    self._send(403, {"error": "origin not allowed"})
+                    return
+                
+                if not self.headers.get("Content-Type", "").startswith("application/json"):
+                    self._send(415, {"error": "expected application/json"})
+                    return
+                
+                if server.token and self.headers.get("X-Sync-Token") != server.token:
+                    self._send(401, {"error": "invalid token"})
+                    return
+                
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length).decode("utf-8") if length else ""
+                
+                try:
+                    submission_id = json.loads(raw or "{}").get("submission_id")
+                except (ValueError, AttributeError):
+                    submission_id = None
+                
+                if not str(submission_id or "").isdigit():
+                    self._send(400, {"error": "submission_id must be a number"})
+                    return
+                
+                submission_id = str(submission_id)
+                queued = server.enqueue(submission_id)
+                self._send(202, {"submission_id": submission_id, "queued": queued})
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
+    
+    def serve_forever(self) -> None:
+        """Start the worker and listen until interrupted"""
+        threading.Thread(target=self._worker, daemon=True).start()
+        
+        httpd = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        print(f"✓ Listening on http://{self.host}:{self.port}/sync")
+        print("  POST {\"submission_id\": <id>} to sync a submission (Ctrl+C to stop)")
+        
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down...")
+        finally:
+            httpd.server_close()
+            
+            # Finish queued work and push anything still pending
+            self.queue.join()
+            with self.lock:
+                if self.push_timer:
+                    self.push_timer.cancel()
+            if self.push_pending:
+                self.flush()